@@ -1,16 +1,206 @@
 import boto3
+import functools
+import itertools
 import json
 import os
+import queue
 import logging
+import math
+import random
+import threading
+import time
 from boto3.dynamodb.conditions import Key, Attr
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Optional, Dict, List, Any, Union
+from typing import Callable, Optional, Dict, Iterable, Iterator, List, Any, Union, Tuple
+
+from cache_helper import TTLCache
+
+try:
+    import orjson
+
+    def _dumps(data: Any) -> str:
+        """Serialize a payload for debug logging (orjson when available)."""
+        return orjson.dumps(data, default=str).decode()
+except ImportError:
+    def _dumps(data: Any) -> str:
+        """Serialize a payload for debug logging (orjson when available)."""
+        return json.dumps(data, default=str)
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared botocore configuration: keep-alive sockets, a larger connection pool
+# and adaptive retries for every DynamoDB handle created by this module.
+_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 10},
+    connect_timeout=1,
+    read_timeout=3,
+)
+
+# (kind, region_name) -> boto3 client or resource, so helpers in the same
+# region reuse one connection pool instead of opening their own. Each kind is
+# only built when a helper first needs it. The plain client cannot be taken
+# from ``resource.meta.client``: the resource registers hooks on its client
+# that (de)serialize every call, which would double-encode the attribute
+# value payloads sent by get/put/update/delete_item and transact_write_items.
+_HANDLES: Dict[Tuple[str, Optional[str]], Any] = {}
+_HANDLES_LOCK = threading.Lock()
+
+# Upper bound on concurrent requests for batch operations, and on the number of
+# attempts made to drain unprocessed keys/items of a single chunk.
+_MAX_BATCH_WORKERS = 16
+_MAX_BATCH_ATTEMPTS = 8
+
+# Error codes DynamoDB returns when a request is throttled.
+_THROTTLING_ERRORS = frozenset({
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+})
+
+# Service limits: keys per BatchGetItem, requests per BatchWriteItem and
+# actions per TransactWriteItems.
+_BATCH_GET_LIMIT = 100
+_BATCH_WRITE_LIMIT = 25
+
+# Requests per BatchWriteItem accepted by DynamoDB-compatible stores such as
+# Alternator; only used when the helper opts in through max_batch_write.
+_COMPATIBLE_BATCH_WRITE_LIMIT = 100
+_MAX_TRANSACT_ITEMS = 100
+
+# (region, table_name) pairs already confirmed by DescribeTable in this process.
+_VALIDATED: set[Tuple[str, str]] = set()
+
+
+# Sentinel marking the end of a prefetched page stream.
+_END_OF_PAGES = object()
+
+_SERIALIZER = TypeSerializer()
+_DESERIALIZER = TypeDeserializer()
+
+
+def _serialize(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a plain Python dictionary to DynamoDB attribute value format."""
+    return {name: _SERIALIZER.serialize(value) for name, value in data.items()}
+
+
+def _deserialize(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a DynamoDB attribute value dictionary to plain Python types."""
+    return {name: _DESERIALIZER.deserialize(value) for name, value in data.items()}
+
+
+def _chunked(items: List[Any], size: int) -> Iterator[List[Any]]:
+    """Yield consecutive slices of at most ``size`` elements, by index."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _prefetch(pages: Iterable[Any], depth: int) -> Iterator[Any]:
+    """
+    Iterate ``pages`` on a background thread, keeping up to ``depth`` pages
+    fetched ahead of the consumer so page requests overlap with processing.
+
+    Errors raised while fetching are re-raised in the consumer. Closing the
+    returned generator stops the producer after its in-flight request.
+
+    :param pages: Page iterable (e.g. a boto3 PageIterator).
+    :param depth: Number of pages to buffer ahead (at least 1).
+    :return: Iterator over the same pages.
+    """
+    buffer: "queue.Queue[Tuple[Any, Optional[BaseException]]]" = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+
+    def put(entry: Tuple[Any, Optional[BaseException]]) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    return
+        except BaseException as error:
+            put((_END_OF_PAGES, error))
+            return
+        put((_END_OF_PAGES, None))
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            page, error = buffer.get()
+            if page is _END_OF_PAGES:
+                if error is not None:
+                    raise error
+                return
+            yield page
+    finally:
+        stop.set()
+
+
+def _backoff(attempt: int, base: float = 0.05, cap: float = 1.0) -> None:
+    """Sleep for a full-jitter exponential backoff delay."""
+    time.sleep(random.uniform(0, min(cap, base * 2 ** attempt)))
+
+
+def _retry_on_throttle(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Retry a DynamoDB call with full-jitter backoff while it is throttled.
+
+    Complements the botocore adaptive retry mode for batch and transactional
+    calls, which can keep hitting throttling after botocore gives up.
+    """
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        for attempt in range(_MAX_BATCH_ATTEMPTS):
+            try:
+                return func(*args, **kwargs)
+            except ClientError as error:
+                code = error.response['Error']['Code']
+                if code not in _THROTTLING_ERRORS or attempt == _MAX_BATCH_ATTEMPTS - 1:
+                    raise
+                logger.warning("Request throttled (%s), retrying %s", code, func.__name__)
+                _backoff(attempt)
+    return wrapper
+
+
+def _get_handle(kind: str, region_name: Optional[str]) -> Any:
+    """
+    Return the DynamoDB client or resource shared by all helpers of a region.
+
+    Handles are created from the boto3 default session on first use, so a
+    profile configured with ``boto3.setup_default_session`` after this module
+    is imported is still honoured.
+
+    :param kind: Either "client" or "resource".
+    :param region_name: AWS region (None for the boto3 default).
+    :return: boto3 DynamoDB client or service resource.
+    """
+    with _HANDLES_LOCK:
+        handle = _HANDLES.get((kind, region_name))
+        if handle is None:
+            factory = boto3.client if kind == "client" else boto3.resource
+            handle = factory("dynamodb", region_name=region_name, config=_CONFIG)
+            _HANDLES[(kind, region_name)] = handle
+        return handle
+
+
 class DynamoDBHelper:
-    """Custom helper for DynamoDB to simplify CRUD operations."""
+    """
+    Custom helper for DynamoDB to simplify CRUD operations.
+
+    For bulk writes prefer put_items/delete_keys over calling put_item or
+    delete_item in a loop: they send up to 25 requests per BatchWriteItem call
+    and dispatch the calls concurrently.
+    """
 
     def __init__(
         self,
@@ -18,6 +208,9 @@ class DynamoDBHelper:
         pk_name: str,
         sk_name: Optional[str] = None,
         region_name: Optional[str] = None,
+        enable_cache: bool = False,
+        validate: bool = True,
+        max_batch_write: int = _BATCH_WRITE_LIMIT,
     ) -> None:
         """
         Initialize the DynamoDB helper.
@@ -26,22 +219,77 @@ class DynamoDBHelper:
         :param region_name: AWS region (optional, defaults to boto3 default).
         :param pk_name: Name of the partition key.
         :param sk_name: Name of the sort key (optional).
+        :param enable_cache: Cache get_item results in-process for 30 seconds
+            (optional). Writes made through this helper invalidate the cached
+            key, but changes made elsewhere may be read stale until the entry
+            expires. Cached items are shared and must be treated as read-only.
+        :param validate: Check that the table exists on construction (default:
+            True). Pass False to defer all network work to the first call.
+        :param max_batch_write: Largest batch_size accepted by put_items and
+            delete_keys (default: 25, the DynamoDB limit). DynamoDB-compatible
+            stores such as Alternator accept up to 100.
+        :raises ValueError: If max_batch_write is outside 1-100.
         """
+        if not 1 <= max_batch_write <= _COMPATIBLE_BATCH_WRITE_LIMIT:
+            raise ValueError(
+                f"max_batch_write must be between 1 and {_COMPATIBLE_BATCH_WRITE_LIMIT}, got {max_batch_write}"
+            )
         self.table_name = table_name
         self.pk_name = pk_name
         self.sk_name = sk_name
-        self.dynamodb_client = boto3.client("dynamodb", region_name=region_name)  # Solo para operaciones específicas
-        self.dynamodb_resource = boto3.resource("dynamodb", region_name=region_name)
-        self.table = self.dynamodb_resource.Table(self.table_name)
-        self._validate_table()
-        logger.info(f"Configured helper for DynamoDB table: {table_name}")
+        self.region_name = region_name
+        # Key condition builders reused by every query
+        self._pk_key = Key(pk_name)
+        self._sk_key = Key(sk_name) if sk_name else None
+        self._cache = TTLCache(maxsize=1024, ttl=30) if enable_cache else None
+        self._max_batch_write = max_batch_write
+        if validate:
+            self._validate_table()
+        logger.info("Configured helper for DynamoDB table: %s", table_name)
+
+    @functools.cached_property
+    def dynamodb_client(self):
+        """Low-level DynamoDB client, created on first use."""
+        return _get_handle("client", self.region_name)
+
+    @functools.cached_property
+    def dynamodb_resource(self):
+        """DynamoDB service resource, created on first use."""
+        return _get_handle("resource", self.region_name)
+
+    @functools.cached_property
+    def table(self):
+        """DynamoDB Table object, created on first use."""
+        return self.dynamodb_resource.Table(self.table_name)
+
+    @functools.cached_property
+    def _query_paginator(self):
+        """
+        Query paginator built on the resource's client, so condition objects
+        and Python-typed values are (de)serialized exactly like Table.query.
+        """
+        return self.dynamodb_resource.meta.client.get_paginator("query")
+
+    @functools.cached_property
+    def _scan_paginator(self):
+        """Scan paginator built on the resource's client, like _query_paginator."""
+        return self.dynamodb_resource.meta.client.get_paginator("scan")
 
     def _validate_table(self) -> None:
-        """Validate that the table exists and is accessible"""
+        """
+        Validate that the table exists and is accessible.
+
+        The check runs once per (region, table) per process, and is skipped
+        entirely when MCP_DDB_SKIP_VALIDATE is set.
+        """
+        cache_key = (self.dynamodb_client.meta.region_name, self.table_name)
+        if cache_key in _VALIDATED or os.getenv("MCP_DDB_SKIP_VALIDATE"):
+            return
         try:
             self.dynamodb_client.describe_table(TableName=self.table_name)
+            _VALIDATED.add(cache_key)
         except ClientError as error:
-            logger.error(f"Table {self.table_name} does not exist or is inaccessible")
+            logger.error("Table %s does not exist or is inaccessible", self.table_name)
             raise error
 
     def get_table(self):
@@ -52,6 +300,23 @@ class DynamoDBHelper:
         """
         return self.table
 
+    def _cache_key(self, item: Dict[str, Any]) -> Tuple[Any, Any]:
+        """Build the get_item cache key from an item or key dictionary."""
+        sk_name = self.sk_name
+        return (item.get(self.pk_name), item.get(sk_name) if sk_name else None)
+
+    def _invalidate(self, items: List[Dict[str, Any]]) -> None:
+        """Drop cached entries for the given items or keys."""
+        cache = self._cache
+        if cache is not None:
+            for item in items:
+                cache.pop(self._cache_key(item))
+
+    def clear_cache(self) -> None:
+        """Drop every cached get_item result (no-op when caching is disabled)."""
+        if self._cache is not None:
+            self._cache.clear()
+
     def get_item(
         self, partition_key: str, sort_key: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
@@ -62,22 +327,32 @@ class DynamoDBHelper:
         :param sort_key: Sort key value (optional).
         :return: Item dictionary or None if not found.
         """
-        key = {self.pk_name: partition_key}
-        log_keys = f"PK: {partition_key}"
-        if sort_key and self.sk_name:
-            key[self.sk_name] = sort_key
-            log_keys += f", SK: {sort_key}"
+        pk_name, sk_name = self.pk_name, self.sk_name
+        key = {pk_name: partition_key}
+        if sort_key and sk_name:
+            key[sk_name] = sort_key
 
-        logger.info(f"Retrieving item with {log_keys}")
+        logger.info("Retrieving item with key %s", key)
+        cache = self._cache
+        if cache is not None:
+            cache_key = self._cache_key(key)
+            item = cache.get(cache_key)
+            if item is not None:
+                logger.info("Item retrieved from cache")
+                return item
         try:
-            response = self.table.get_item(Key=key)
+            response = self.dynamodb_client.get_item(TableName=self.table_name, Key=_serialize(key))
             item = response.get("Item")
+            if item:
+                item = _deserialize(item)
+                if cache is not None:
+                    cache.set(cache_key, item)
             logger.info("Item retrieved successfully" if item else "Item not found")
             return item
         except ClientError as error:
             logger.error(
-                f"Failed to retrieve item - Table: {self.table_name} | {log_keys} | "
-                f"Error: {error.response['Error']['Code']}"
+                "Failed to retrieve item - Table: %s | Key: %s | Error: %s",
+                self.table_name, key, error.response['Error']['Code'],
             )
             raise error
 
@@ -92,32 +367,43 @@ class DynamoDBHelper:
         :param limit: Maximum items per query (default: 50).
         :return: List of matching items.
         """
+        all_items = list(self.iter_query_items_by_begins_pk_sk(partition_key, sort_key_portion, limit))
+        logger.info("Total items retrieved: %d", len(all_items))
+        return all_items
+
+    def iter_query_items_by_begins_pk_sk(
+        self, partition_key: str, sort_key_portion: str, limit: int = 50, prefetch: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield items where PK and SK begin with the provided values,
+        fetching the next page only when the current one is consumed.
+
+        :param partition_key: Partition key prefix.
+        :param sort_key_portion: Sort key prefix.
+        :param limit: Maximum items per query (default: 50).
+        :param prefetch: Pages to fetch ahead on a background thread while the
+            caller processes the current one (default: 0, fetch on demand).
+        :return: Iterator over matching items.
+        """
         logger.info(
-            f"Querying items with PK begins_with: {partition_key}, "
-            f"SK begins_with: {sort_key_portion}"
+            "Querying items with PK begins_with: %s, SK begins_with: %s",
+            partition_key, sort_key_portion,
         )
-        all_items = []
+        key_condition = self._pk_key.begins_with(partition_key) & self._sk_key.begins_with(sort_key_portion)
+        pages = self._query_paginator.paginate(
+            TableName=self.table_name,
+            KeyConditionExpression=key_condition,
+            PaginationConfig={"PageSize": limit},
+        )
+        if prefetch:
+            pages = _prefetch(pages, prefetch)
         try:
-            key_condition = Key(self.pk_name).begins_with(partition_key) & Key(self.sk_name).begins_with(sort_key_portion)
-            response = self.table.query(KeyConditionExpression=key_condition, Limit=limit)
-            all_items.extend(response.get("Items", []))
-            logger.debug(f"Initial query returned {len(response.get('Items', []))} items")
-
-            while "LastEvaluatedKey" in response:
-                response = self.table.query(
-                    KeyConditionExpression=key_condition,
-                    Limit=limit,
-                    ExclusiveStartKey=response["LastEvaluatedKey"],
-                )
-                all_items.extend(response.get("Items", []))
-                logger.debug(f"Paged query returned {len(response.get('Items', []))} items")
-
-            logger.info(f"Total items retrieved: {len(all_items)}")
-            return all_items
+            for page in pages:
+                yield from page.get("Items", ())
         except ClientError as error:
             logger.error(
-                f"Query failed - Table: {self.table_name} | PK: {partition_key} | "
-                f"SK: {sort_key_portion} | Error: {error.response['Error']['Message']}"
+                "Query failed - Table: %s | PK: %s | SK: %s | Error: %s",
+                self.table_name, partition_key, sort_key_portion, error.response['Error']['Message'],
             )
             raise error
 
@@ -129,20 +415,21 @@ class DynamoDBHelper:
         :param condition: Optional condition expression for the put operation.
         :return: Response from DynamoDB.
         """
-        logger.info(f"Inserting item into table {self.table_name}")
-        logger.debug(f"Data: {data}")
+        logger.info("Inserting item into table %s", self.table_name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Data: %s", _dumps(data))
         try:
-            kwargs = {"Item": data}
+            kwargs = {"TableName": self.table_name, "Item": _serialize(data)}
             if condition:
                 kwargs["ConditionExpression"] = condition
-            response = self.table.put_item(**kwargs)
+            response = self.dynamodb_client.put_item(**kwargs)
+            self._invalidate([data])
             logger.info("Item inserted successfully")
             return response
         except ClientError as error:
             logger.error(
-                f"Failed to insert item - Table: {self.table_name} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
+                "Failed to insert item - Table: %s | Error: %s | Message: %s",
+                self.table_name, error.response['Error']['Code'], error.response['Error']['Message'],
             )
             raise error
 
@@ -164,32 +451,36 @@ class DynamoDBHelper:
         :param condition_expression: Optional condition for the update.
         :return: Response from DynamoDB.
         """
-        key = {self.pk_name: partition_key}
-        log_keys = f"{self.pk_name}: {partition_key}"
-        if sort_key and self.sk_name:
-            key[self.sk_name] = sort_key
-            log_keys += f", {self.sk_name}: {sort_key}"
+        pk_name, sk_name = self.pk_name, self.sk_name
+        key = {pk_name: partition_key}
+        if sort_key and sk_name:
+            key[sk_name] = sort_key
 
-        logger.info(f"Updating item with {log_keys}")
+        logger.info("Updating item with key %s", key)
         try:
             kwargs = {
-                "Key": key,
+                "TableName": self.table_name,
+                "Key": _serialize(key),
                 "UpdateExpression": update_expression,
-                "ExpressionAttributeValues": expression_attribute_values,
                 "ReturnValues": "UPDATED_NEW",
             }
+            if expression_attribute_values:
+                kwargs["ExpressionAttributeValues"] = _serialize(expression_attribute_values)
             if condition_expression:
                 kwargs["ConditionExpression"] = condition_expression
 
-            response = self.table.update_item(**kwargs)
+            response = self.dynamodb_client.update_item(**kwargs)
+            self._invalidate([key])
+            if "Attributes" in response:
+                response["Attributes"] = _deserialize(response["Attributes"])
             logger.info("Item updated successfully")
-            logger.debug(f"Updated attributes: {response.get('Attributes', {})}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Updated attributes: %s", _dumps(response.get('Attributes', {})))
             return response
         except ClientError as error:
             logger.error(
-                f"Failed to update item - Table: {self.table_name} | {log_keys} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
+                "Failed to update item - Table: %s | Key: %s | Error: %s | Message: %s",
+                self.table_name, key, error.response['Error']['Code'], error.response['Error']['Message'],
             )
             raise error
 
@@ -207,26 +498,25 @@ class DynamoDBHelper:
         :param condition_expression: Optional condition for the delete.
         :return: Response from DynamoDB.
         """
-        key = {self.pk_name: partition_key}
-        log_keys = f"{self.pk_name}: {partition_key}"
-        if sort_key and self.sk_name:
-            key[self.sk_name] = sort_key
-            log_keys += f", {self.sk_name}: {sort_key}"
+        pk_name, sk_name = self.pk_name, self.sk_name
+        key = {pk_name: partition_key}
+        if sort_key and sk_name:
+            key[sk_name] = sort_key
 
-        logger.info(f"Deleting item with {log_keys}")
+        logger.info("Deleting item with key %s", key)
         try:
-            kwargs = {"Key": key}
+            kwargs = {"TableName": self.table_name, "Key": _serialize(key)}
             if condition_expression:
                 kwargs["ConditionExpression"] = condition_expression
 
-            response = self.table.delete_item(**kwargs)
+            response = self.dynamodb_client.delete_item(**kwargs)
+            self._invalidate([key])
             logger.info("Item deleted successfully")
             return response
         except ClientError as error:
             logger.error(
-                f"Failed to delete item - Table: {self.table_name} | {log_keys} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
+                "Failed to delete item - Table: %s | Key: %s | Error: %s | Message: %s",
+                self.table_name, key, error.response['Error']['Code'], error.response['Error']['Message'],
             )
             raise error
 
@@ -239,39 +529,77 @@ class DynamoDBHelper:
         :param keys: List of key dictionaries (e.g., [{"ALUMNO_ID": "val", "DATE_TIME": "val"}]).
         :return: List of retrieved items.
         """
-        logger.info(f"Batch retrieving {len(keys)} items from table {self.table_name}")
+        logger.info("Batch retrieving %d items from table %s", len(keys), self.table_name)
+        if not keys:
+            return []
+
+        # BatchGetItem rejects requests that repeat a key
+        seen = set()
+        unique_keys = []
+        for key in keys:
+            fingerprint = tuple(sorted(key.items()))
+            if fingerprint not in seen:
+                seen.add(fingerprint)
+                unique_keys.append(key)
+        keys = unique_keys
+
+        # Chunks of up to 100 keys are fetched concurrently
+        workers = min(_MAX_BATCH_WORKERS, math.ceil(len(keys) / _BATCH_GET_LIMIT))
         all_items = []
         try:
-            while keys:
-                batch = keys[:100]  # DynamoDB batch limit is 100
-                response = self.dynamodb_resource.batch_get_item(
-                    RequestItems={
-                        self.table_name: {
-                            "Keys": batch,
-                            "ConsistentRead": False,
-                        }
-                    }
-                )
-                items = response.get("Responses", {}).get(self.table_name, [])
-                all_items.extend(items)
-                logger.debug(f"Batch retrieved {len(items)} items")
-
-                # Handle unprocessed keys
-                unprocessed = response.get("UnprocessedKeys", {}).get(self.table_name, {}).get("Keys", [])
-                keys = unprocessed
-                if unprocessed:
-                    logger.warning(f"Retrying {len(unprocessed)} unprocessed keys")
-
-            logger.info(f"Total items retrieved: {len(all_items)}")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._batch_get_chunk, chunk)
+                    for chunk in _chunked(keys, _BATCH_GET_LIMIT)
+                ]
+                for future in as_completed(futures):
+                    all_items.extend(future.result())
+
+            logger.info("Total items retrieved: %d", len(all_items))
             return all_items
         except ClientError as error:
             logger.error(
-                f"Batch get failed - Table: {self.table_name} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
+                "Batch get failed - Table: %s | Error: %s | Message: %s",
+                self.table_name, error.response['Error']['Code'], error.response['Error']['Message'],
             )
             raise error
 
+    @_retry_on_throttle
+    def _batch_get_chunk(self, keys: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Retrieve one chunk of up to 100 keys, retrying unprocessed keys and
+        throttled requests with jittered exponential backoff.
+
+        :param keys: List of key dictionaries (at most 100).
+        :return: List of retrieved items.
+        :raises RuntimeError: If keys remain unprocessed after all attempts.
+        """
+        items = []
+        for attempt in range(_MAX_BATCH_ATTEMPTS):
+            response = self.dynamodb_resource.batch_get_item(
+                RequestItems={
+                    self.table_name: {
+                        "Keys": keys,
+                        "ConsistentRead": False,
+                    }
+                }
+            )
+            chunk_items = response.get("Responses", {}).get(self.table_name, [])
+            items.extend(chunk_items)
+            logger.debug("Batch retrieved %d items", len(chunk_items))
+
+            # Handle unprocessed keys
+            keys = response.get("UnprocessedKeys", {}).get(self.table_name, {}).get("Keys", [])
+            if not keys:
+                return items
+            logger.warning("Retrying %d unprocessed keys", len(keys))
+            _backoff(attempt)
+
+        raise RuntimeError(
+            f"Batch get left {len(keys)} unprocessed keys after "
+            f"{_MAX_BATCH_ATTEMPTS} attempts - Table: {self.table_name}"
+        )
+
     def batch_write_items(
         self, put_items: Optional[List[Dict[str, Any]]] = None, delete_items: Optional[List[Dict[str, str]]] = None
     ) -> Dict[str, Any]:
@@ -282,75 +610,228 @@ class DynamoDBHelper:
         :param delete_items: List of keys to delete (simple dictionaries).
         :return: Response from DynamoDB.
         """
-        logger.info(f"Batch writing to table {self.table_name}")
-        put_items = put_items or []
-        delete_items = delete_items or []
+        logger.info("Batch writing to table %s", self.table_name)
+        self._batch_write(put_items or [], delete_items or [])
+        return {}  # chunked writes don't return a single standard response
 
-        logger.debug(f"Processing {len(put_items)} puts and {len(delete_items)} deletes")
+    def put_items(self, items: List[Dict[str, Any]], batch_size: Optional[int] = None) -> None:
+        """
+        Insert many items using BatchWriteItem instead of one put_item per item.
+
+        :param items: List of items to put (simple Python dictionaries).
+        :param batch_size: Requests per BatchWriteItem call, from 1 up to the
+            helper's max_batch_write (the default).
+        :raises ValueError: If batch_size is outside that range.
+        """
+        logger.info("Putting %d items into table %s", len(items), self.table_name)
+        self._batch_write(items, [], batch_size)
+
+    def delete_keys(self, keys: List[Dict[str, Any]], batch_size: Optional[int] = None) -> None:
+        """
+        Delete many items using BatchWriteItem instead of one delete_item per key.
+
+        :param keys: List of keys to delete (simple dictionaries).
+        :param batch_size: Requests per BatchWriteItem call, from 1 up to the
+            helper's max_batch_write (the default).
+        :raises ValueError: If batch_size is outside that range.
+        """
+        logger.info("Deleting %d items from table %s", len(keys), self.table_name)
+        self._batch_write([], keys, batch_size)
+
+    def _batch_write(
+        self,
+        put_items: List[Dict[str, Any]],
+        delete_items: List[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> None:
+        """
+        Write puts and deletes in concurrent BatchWriteItem chunks.
+
+        :param put_items: List of items to put.
+        :param delete_items: List of keys to delete.
+        :param batch_size: Requests per BatchWriteItem call (default: max_batch_write).
+        :raises ValueError: If batch_size is outside 1-max_batch_write.
+        """
+        if batch_size is None:
+            batch_size = self._max_batch_write
+        elif not 1 <= batch_size <= self._max_batch_write:
+            raise ValueError(
+                f"batch_size must be between 1 and {self._max_batch_write}, got {batch_size}"
+            )
+        logger.debug("Processing %d puts and %d deletes", len(put_items), len(delete_items))
+        requests = [{"PutRequest": {"Item": item}} for item in put_items]
+        requests += [{"DeleteRequest": {"Key": key}} for key in delete_items]
+        # Chunks of up to batch_size requests are written concurrently
+        workers = min(8, math.ceil(len(requests) / batch_size)) or 1
         try:
-            with self.table.batch_writer() as batch:
-                for item in put_items:
-                    batch.put_item(Item=item)
-                for key in delete_items:
-                    batch.delete_item(Key=key)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._batch_write_chunk, chunk)
+                    for chunk in _chunked(requests, batch_size)
+                ]
+                for future in as_completed(futures):
+                    future.result()
+            self._invalidate(put_items)
+            self._invalidate(delete_items)
 
             logger.info("Batch write completed successfully")
-            return {}  # batch_writer doesn't return a standard response
         except ClientError as error:
             logger.error(
-                f"Batch write failed - Table: {self.table_name} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
+                "Batch write failed - Table: %s | Error: %s | Message: %s",
+                self.table_name, error.response['Error']['Code'], error.response['Error']['Message'],
             )
             raise error
 
+    @_retry_on_throttle
+    def _batch_write_chunk(self, requests: List[Dict[str, Any]]) -> None:
+        """
+        Write one chunk of put/delete requests, retrying unprocessed items and
+        throttled requests with jittered exponential backoff.
+
+        :param requests: List of PutRequest/DeleteRequest dictionaries.
+        :raises RuntimeError: If items remain unprocessed after all attempts.
+        """
+        for attempt in range(_MAX_BATCH_ATTEMPTS):
+            response = self.dynamodb_resource.batch_write_item(
+                RequestItems={self.table_name: requests}
+            )
+            requests = response.get("UnprocessedItems", {}).get(self.table_name, [])
+            if not requests:
+                return
+            logger.warning("Retrying %d unprocessed items", len(requests))
+            _backoff(attempt)
+
+        raise RuntimeError(
+            f"Batch write left {len(requests)} unprocessed items after "
+            f"{_MAX_BATCH_ATTEMPTS} attempts - Table: {self.table_name}"
+        )
+
     def scan_table(self, filter_expression=None, expression_attribute_values=None, 
-               expression_attribute_names=None, limit=None):
+               expression_attribute_names=None, limit=None, parallel_segments=1):
         """
-        Escanea la tabla DynamoDB usando el recurso de alto nivel
+        Escanea la tabla DynamoDB completa, recorriendo todas las páginas
         
         Args:
             filter_expression (str, optional): Expresión de filtro
             expression_attribute_values (dict, optional): Valores de atributos de expresión
             expression_attribute_names (dict, optional): Nombres de atributos de expresión
             limit (int, optional): Número máximo de elementos a retornar
+            parallel_segments (int, optional): Segmentos a escanear en paralelo
+                (Segment/TotalSegments de DynamoDB), con un máximo de 16 hilos
+                simultáneos; 1 escanea secuencialmente
             
         Returns:
             list: Lista de elementos que coinciden con el filtro
         """
+        if parallel_segments <= 1:
+            items = list(self.iter_scan_table(
+                filter_expression=filter_expression,
+                expression_attribute_values=expression_attribute_values,
+                expression_attribute_names=expression_attribute_names,
+                limit=limit,
+            ))
+            logger.info("Scan completed. Found %d items", len(items))
+            return items
+
+        scan_params = self._scan_params(filter_expression, expression_attribute_values, expression_attribute_names)
+        logger.info("Scanning table %s in %d parallel segments", self.table_name, parallel_segments)
         try:
-            scan_params = {}
-            
-            if filter_expression:
-                scan_params['FilterExpression'] = filter_expression
-                
-            if expression_attribute_values:
-                scan_params['ExpressionAttributeValues'] = expression_attribute_values
-                
-            if expression_attribute_names:
-                scan_params['ExpressionAttributeNames'] = expression_attribute_names
-                
-            if limit:
-                scan_params['Limit'] = limit
-                
-            logger.info(f"Scanning table {self.table_name}")
-            
-            response = self.table.scan(**scan_params)
-            items = response.get('Items', [])
-            
-            logger.info(f"Scan completed. Found {len(items)} items")
+            with ThreadPoolExecutor(max_workers=min(_MAX_BATCH_WORKERS, parallel_segments)) as executor:
+                futures = [
+                    executor.submit(self._scan_segment, scan_params, segment, parallel_segments, limit)
+                    for segment in range(parallel_segments)
+                ]
+                items = [item for future in futures for item in future.result()]
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            error_message = e.response['Error']['Message']
+            logger.error("Scan failed - Table: %s | Error: %s | Message: %s", self.table_name, error_code, error_message)
+            raise e
+        except Exception as e:
+            logger.error("Error in scan operation: %s", e)
+            raise e
+
+        if limit:
+            items = items[:limit]
+        logger.info("Scan completed. Found %d items", len(items))
+        return items
+
+    def iter_scan_table(self, filter_expression=None, expression_attribute_values=None,
+                        expression_attribute_names=None, limit=None, prefetch=0):
+        """
+        Escanea la tabla DynamoDB y entrega los elementos página por página
+        
+        Args:
+            filter_expression (str, optional): Expresión de filtro
+            expression_attribute_values (dict, optional): Valores de atributos de expresión
+            expression_attribute_names (dict, optional): Nombres de atributos de expresión
+            limit (int, optional): Número máximo de elementos a retornar
+            prefetch (int, optional): Páginas a descargar por adelantado en segundo plano
             
-            return items
+        Returns:
+            Iterator: Elementos que coinciden con el filtro
+        """
+        scan_params = self._scan_params(filter_expression, expression_attribute_values, expression_attribute_names)
+        if limit:
+            scan_params['PaginationConfig'] = {'MaxItems': limit}
             
+        logger.info("Scanning table %s", self.table_name)
+        
+        try:
+            pages = self._scan_paginator.paginate(**scan_params)
+            if prefetch:
+                pages = _prefetch(pages, prefetch)
+            for page in pages:
+                yield from page.get('Items', ())
         except ClientError as e:
             error_code = e.response['Error']['Code']
             error_message = e.response['Error']['Message']
-            logger.error(f"Scan failed - Table: {self.table_name} | Error: {error_code} | Message: {error_message}")
+            logger.error("Scan failed - Table: %s | Error: %s | Message: %s", self.table_name, error_code, error_message)
             raise e
         except Exception as e:
-            logger.error(f"Error in scan operation: {str(e)}")
+            logger.error("Error in scan operation: %s", e)
             raise e
 
+    def _scan_params(self, filter_expression=None, expression_attribute_values=None,
+                     expression_attribute_names=None):
+        """
+        Construye los parámetros comunes de una operación scan
+        
+        Returns:
+            dict: Parámetros para el paginador de scan
+        """
+        scan_params = {'TableName': self.table_name}
+        
+        if filter_expression:
+            scan_params['FilterExpression'] = filter_expression
+            
+        if expression_attribute_values:
+            scan_params['ExpressionAttributeValues'] = expression_attribute_values
+            
+        if expression_attribute_names:
+            scan_params['ExpressionAttributeNames'] = expression_attribute_names
+            
+        return scan_params
+
+    def _scan_segment(self, scan_params, segment, total_segments, limit=None):
+        """
+        Escanea un segmento de la tabla recorriendo todas sus páginas
+        
+        Args:
+            scan_params (dict): Parámetros comunes del scan
+            segment (int): Índice del segmento a escanear
+            total_segments (int): Número total de segmentos
+            limit (int, optional): Número máximo de elementos a retornar del segmento
+            
+        Returns:
+            list: Elementos del segmento
+        """
+        params = dict(scan_params, Segment=segment, TotalSegments=total_segments)
+        if limit:
+            params['PaginationConfig'] = {'MaxItems': limit}
+        pages = self._scan_paginator.paginate(**params)
+        return list(itertools.chain.from_iterable(page.get('Items', ()) for page in pages))
+
     def query_table(self, key_condition, filter_expression=None, expression_attribute_values=None, 
                     expression_attribute_names=None, limit=None, scan_forward=True):
         """
@@ -387,22 +868,22 @@ class DynamoDBHelper:
             if not scan_forward:
                 query_params['ScanIndexForward'] = False
                 
-            logger.info(f"Querying table {self.table_name}")
+            logger.info("Querying table %s", self.table_name)
             
             response = self.table.query(**query_params)
             items = response.get('Items', [])
             
-            logger.info(f"Query completed. Found {len(items)} items")
+            logger.info("Query completed. Found %d items", len(items))
             
             return items
             
         except ClientError as e:
             error_code = e.response['Error']['Code']
             error_message = e.response['Error']['Message']
-            logger.error(f"Query failed - Table: {self.table_name} | Error: {error_code} | Message: {error_message}")
+            logger.error("Query failed - Table: %s | Error: %s | Message: %s", self.table_name, error_code, error_message)
             raise e
         except Exception as e:
-            logger.error(f"Error in query operation: {str(e)}")
+            logger.error("Error in query operation: %s", e)
             raise e
     
     def query_by_index(
@@ -425,38 +906,67 @@ class DynamoDBHelper:
         :param expression_attribute_names: Optional attribute names for expressions.
         :return: List of matching items.
         """
-        logger.info(f"Querying index {index_name} on table {self.table_name}")
-        all_items = []
-        try:
-            kwargs = {
-                "IndexName": index_name,
-                "KeyConditionExpression": key_condition_expression,
-                "Limit": limit,
-            }
-            if filter_expression:
-                kwargs["FilterExpression"] = filter_expression
-            if projection_expression:
-                kwargs["ProjectionExpression"] = projection_expression
-            if expression_attribute_names:
-                kwargs["ExpressionAttributeNames"] = expression_attribute_names
+        all_items = list(
+            self.iter_query_by_index(
+                index_name,
+                key_condition_expression,
+                filter_expression=filter_expression,
+                limit=limit,
+                projection_expression=projection_expression,
+                expression_attribute_names=expression_attribute_names,
+            )
+        )
+        logger.info("Total items retrieved: %d", len(all_items))
+        return all_items
 
-            response = self.table.query(**kwargs)
-            all_items.extend(response.get("Items", []))
-            logger.debug(f"Initial query returned {len(response.get('Items', []))} items")
+    def iter_query_by_index(
+        self,
+        index_name: str,
+        key_condition_expression: Union[Key, str],
+        filter_expression: Optional[Union[Attr, str]] = None,
+        limit: int = 50,
+        projection_expression: Optional[str] = None,
+        expression_attribute_names: Optional[Dict[str, str]] = None,
+        prefetch: int = 0,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield items from a secondary index query, fetching the next
+        page only when the current one is consumed.
 
-            while "LastEvaluatedKey" in response:
-                kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
-                response = self.table.query(**kwargs)
-                all_items.extend(response.get("Items", []))
-                logger.debug(f"Paged query returned {len(response.get('Items', []))} items")
+        :param index_name: Name of the secondary index.
+        :param key_condition_expression: Key condition for the query (e.g., Key('index_key').eq('value')).
+        :param filter_expression: Optional filter expression.
+        :param limit: Maximum items per query (default: 50).
+        :param projection_expression: Optional projection expression.
+        :param expression_attribute_names: Optional attribute names for expressions.
+        :param prefetch: Pages to fetch ahead on a background thread while the
+            caller processes the current one (default: 0, fetch on demand).
+        :return: Iterator over matching items.
+        """
+        logger.info("Querying index %s on table %s", index_name, self.table_name)
+        kwargs = {
+            "TableName": self.table_name,
+            "IndexName": index_name,
+            "KeyConditionExpression": key_condition_expression,
+            "PaginationConfig": {"PageSize": limit},
+        }
+        if filter_expression:
+            kwargs["FilterExpression"] = filter_expression
+        if projection_expression:
+            kwargs["ProjectionExpression"] = projection_expression
+        if expression_attribute_names:
+            kwargs["ExpressionAttributeNames"] = expression_attribute_names
 
-            logger.info(f"Total items retrieved: {len(all_items)}")
-            return all_items
+        pages = self._query_paginator.paginate(**kwargs)
+        if prefetch:
+            pages = _prefetch(pages, prefetch)
+        try:
+            for page in pages:
+                yield from page.get("Items", ())
         except ClientError as error:
             logger.error(
-                f"Index query failed - Table: {self.table_name} | Index: {index_name} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
+                "Index query failed - Table: %s | Index: %s | Error: %s | Message: %s",
+                self.table_name, index_name, error.response['Error']['Code'], error.response['Error']['Message'],
             )
             raise error
 
@@ -465,6 +975,7 @@ class DynamoDBHelper:
         put_items: Optional[List[Dict[str, Any]]] = None,
         delete_items: Optional[List[Dict[str, Dict[str, str]]]] = None,
         update_items: Optional[List[Dict[str, Any]]] = None,
+        atomic: bool = True,
     ) -> Dict[str, Any]:
         """
         Perform a transactional write operation (put, delete, or update) on multiple items.
@@ -472,39 +983,79 @@ class DynamoDBHelper:
         :param put_items: List of items to put (DynamoDB attribute value format).
         :param delete_items: List of keys to delete.
         :param update_items: List of update operations (with Key, UpdateExpression, etc.).
-        :return: Response from DynamoDB.
+        :param atomic: If False, more than 100 operations are split into
+            sub-transactions of up to 100 that run concurrently; each one is
+            atomic on its own, but not the write as a whole (default: True).
+        :return: Response from DynamoDB, or {"Responses": [...]} with one
+            response per sub-transaction when the write was split.
+        :raises ValueError: If more than 100 operations are requested with atomic=True.
         """
-        logger.info(f"Executing transactional write on table {self.table_name}")
+        logger.info("Executing transactional write on table %s", self.table_name)
         put_items = put_items or []
         delete_items = delete_items or []
         update_items = update_items or []
-        transact_items = []
-
-        for item in put_items:
-            transact_items.append({"Put": {"TableName": self.table_name, "Item": item}})
-        for key in delete_items:
-            transact_items.append({"Delete": {"TableName": self.table_name, "Key": key}})
-        for update in update_items:
-            transact_items.append(
+
+        total = len(put_items) + len(delete_items) + len(update_items)
+        if total > _MAX_TRANSACT_ITEMS and atomic:
+            raise ValueError(
+                f"Transactional write supports at most {_MAX_TRANSACT_ITEMS} operations, got {total}; "
+                f"pass atomic=False to split it into independent transactions"
+            )
+
+        table_name = self.table_name
+        transact_items = [
+            *({"Put": {"TableName": table_name, "Item": item}} for item in put_items),
+            *({"Delete": {"TableName": table_name, "Key": key}} for key in delete_items),
+            *(
                 {
                     "Update": {
-                        "TableName": self.table_name,
+                        "TableName": table_name,
                         "Key": update["Key"],
                         "UpdateExpression": update["UpdateExpression"],
                         "ExpressionAttributeValues": update.get("ExpressionAttributeValues"),
                     }
                 }
-            )
+                for update in update_items
+            ),
+        ]
 
-        logger.debug(f"Processing {len(transact_items)} transactional operations")
+        logger.debug("Processing %d transactional operations", len(transact_items))
         try:
-            response = self.dynamodb_client.transact_write_items(TransactItems=transact_items)
+            if total <= _MAX_TRANSACT_ITEMS:
+                response = self._transact_write(transact_items)
+                if self._cache is not None:
+                    # Keys are in attribute value format here; drop everything
+                    self._cache.clear()
+            else:
+                n_chunks = math.ceil(total / _MAX_TRANSACT_ITEMS)
+                logger.info("Splitting %d operations into %d transactions", total, n_chunks)
+                try:
+                    with ThreadPoolExecutor(max_workers=min(_MAX_BATCH_WORKERS, n_chunks)) as executor:
+                        futures = [
+                            executor.submit(self._transact_write, chunk)
+                            for chunk in _chunked(transact_items, _MAX_TRANSACT_ITEMS)
+                        ]
+                        wait(futures)
+                    response = {"Responses": [future.result() for future in futures]}
+                finally:
+                    # Some sub-transactions may have committed even if another failed
+                    if self._cache is not None:
+                        self._cache.clear()
             logger.info("Transactional write completed successfully")
             return response
         except ClientError as error:
             logger.error(
-                f"Transactional write failed - Table: {self.table_name} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
+                "Transactional write failed - Table: %s | Error: %s | Message: %s",
+                self.table_name, error.response['Error']['Code'], error.response['Error']['Message'],
             )
-            raise error
\ No newline at end of file
+            raise error
+
+    @_retry_on_throttle
+    def _transact_write(self, transact_items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run a single TransactWriteItems call, retrying while throttled.
+
+        :param transact_items: Up to 100 transactional operations.
+        :return: Response from DynamoDB.
+        """
+        return self.dynamodb_client.transact_write_items(TransactItems=transact_items)
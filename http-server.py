@@ -1,8 +1,16 @@
 from typing import Any
+import asyncio
+import random
 import boto3
 import httpx
 from mcp.server.fastmcp import FastMCP
 
+from cache_helper import TTLCache
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 from utils import get_text_from_file_by_title, get_titles_resources_by_silabus
 
 # Initialize FastMCP server
@@ -16,31 +24,88 @@ mcp = FastMCP("weather", stateless_http=True)
 # Constants
 NWS_API_BASE = "https://api.weather.gov"
 USER_AGENT = "weather-app/1.0"
-
-async def make_nws_request(url: str) -> dict[str, Any] | None:
-    """Make a request to the NWS API with proper error handling."""
-    headers = {
+POINTS_CACHE_TTL = 24 * 60 * 60  # Grid metadata for a location rarely changes
+NWS_MAX_ATTEMPTS = 4
+NWS_MAX_RETRY_DELAY = 10.0
+NWS_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# Shared client so NWS connections (and their TLS sessions) are kept alive
+# across requests instead of being re-established on every call
+http_client = httpx.AsyncClient(
+    headers={
         "User-Agent": USER_AGENT,
         "Accept": "application/geo+json"
-    }
-    async with httpx.AsyncClient() as client:
+    },
+    timeout=30.0,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+)
+
+def retry_delay(attempt: int, retry_after: str | None = None) -> float:
+    """Seconds to wait before retrying: Retry-After if given, else jittered exponential backoff."""
+    if retry_after:
+        try:
+            return min(float(retry_after), NWS_MAX_RETRY_DELAY)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    return min(NWS_MAX_RETRY_DELAY, 2 ** attempt) + random.uniform(0, 1)
+
+async def make_nws_request(url: str) -> dict[str, Any] | None:
+    """Make a request to the NWS API with proper error handling.
+
+    Connection errors, timeouts and 429/5xx responses are retried up to
+    NWS_MAX_ATTEMPTS times before giving up.
+    """
+    for attempt in range(NWS_MAX_ATTEMPTS):
+        last_attempt = attempt == NWS_MAX_ATTEMPTS - 1
         try:
-            response = await client.get(url, headers=headers, timeout=30.0)
+            response = await http_client.get(url)
+            if response.status_code in NWS_RETRYABLE_STATUS and not last_attempt:
+                await asyncio.sleep(retry_delay(attempt, response.headers.get("Retry-After")))
+                continue
             response.raise_for_status()
-            return response.json()
-        except Exception:
+            return json_loads(response.content)
+        except httpx.TransportError:
+            if last_attempt:
+                return None
+            await asyncio.sleep(retry_delay(attempt))
+        except (httpx.HTTPError, ValueError):
             return None
+    return None
+
+# /points responses keyed by coordinates rounded to 3 decimals (~100 m)
+points_cache = TTLCache(maxsize=10_000, ttl=POINTS_CACHE_TTL)
+
+async def get_points(latitude: float, longitude: float) -> dict[str, Any] | None:
+    """Get the NWS grid metadata for a location, cached for a day."""
+    key = (round(latitude, 3), round(longitude, 3))
+    points_data = points_cache.get(key)
+    if points_data is None:
+        points_data = await make_nws_request(f"{NWS_API_BASE}/points/{key[0]},{key[1]}")
+        if points_data:
+            points_cache.set(key, points_data)
+    return points_data
+
+ALERT_TEMPLATE = """
+Event: {event}
+Area: {areaDesc}
+Severity: {severity}
+Description: {description}
+Instructions: {instruction}
+"""
+
+class AlertProperties(dict):
+    """Alert properties that fall back to a default text for missing fields."""
+    DEFAULTS = {
+        "description": "No description available",
+        "instruction": "No specific instructions provided",
+    }
+
+    def __missing__(self, key: str) -> str:
+        return self.DEFAULTS.get(key, "Unknown")
 
 def format_alert(feature: dict) -> str:
     """Format an alert feature into a readable string."""
-    props = feature["properties"]
-    return f"""
-Event: {props.get('event', 'Unknown')}
-Area: {props.get('areaDesc', 'Unknown')}
-Severity: {props.get('severity', 'Unknown')}
-Description: {props.get('description', 'No description available')}
-Instructions: {props.get('instruction', 'No specific instructions provided')}
-"""
+    return ALERT_TEMPLATE.format_map(AlertProperties(feature["properties"]))
 
 @mcp.tool(name="get_alerts", description="Get weather alerts for a US state")
 async def get_alerts(state: str) -> str:
@@ -58,8 +123,7 @@ async def get_alerts(state: str) -> str:
     if not data["features"]:
         return "No active alerts for this state."
 
-    alerts = [format_alert(feature) for feature in data["features"]]
-    return "\n---\n".join(alerts)
+    return "\n---\n".join(format_alert(feature) for feature in data["features"])
 
 @mcp.tool(name="get_forecast", description="Get weather forecast for a location")
 async def get_forecast(latitude: float, longitude: float) -> str:
@@ -70,8 +134,7 @@ async def get_forecast(latitude: float, longitude: float) -> str:
         longitude: Longitude of the location
     """
     # First get the forecast grid endpoint
-    points_url = f"{NWS_API_BASE}/points/{latitude},{longitude}"
-    points_data = await make_nws_request(points_url)
+    points_data = await get_points(latitude, longitude)
 
     if not points_data:
         return "Unable to fetch forecast data for this location."
@@ -102,15 +165,15 @@ async def get_text_from_file(title: str) -> str:
     """Get text content from a file by its title."""
     text = await get_text_from_file_by_title(title)
     if not text:
-        return {"No content found for the specified file title."}
+        return "No content found for the specified file title."
     return text
 
 @mcp.tool(name="get_resources_by_syllabus", description="Get titles of resources associated with a syllabus")
-async def get_resources_by_syllabus(syllabus_id: str) -> list[str]:
+async def get_resources_by_syllabus(syllabus_id: str) -> list[str] | str:
     """Get titles of resources associated with a syllabus."""
     titles = await get_titles_resources_by_silabus(syllabus_id)
     if not titles:
-        return {"No resources found for the specified syllabus."}
+        return "No resources found for the specified syllabus."
     return titles
 
 if __name__ == "__main__":
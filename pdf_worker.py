@@ -0,0 +1,59 @@
+import threading
+from io import BytesIO
+from PyPDF2 import PdfReader
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# Funciones ejecutadas en procesos hijos: este módulo no debe tener efectos
+# secundarios al importarse (sin sesiones AWS ni helpers), ya que cada
+# proceso del pool lo importa.
+
+# PDFium no es thread-safe: las llamadas se serializan entre hilos
+_pdfium_lock = threading.Lock()
+
+def count_pages(pdf_bytes: bytes) -> int:
+    """
+    Obtiene el número de páginas de un PDF (solo lee la tabla de referencias).
+
+    :param pdf_bytes: Contenido binario del archivo PDF
+    :return: Número de páginas
+    """
+    if pdfium is not None:
+        with _pdfium_lock:
+            pdf = pdfium.PdfDocument(pdf_bytes)
+            try:
+                return len(pdf)
+            finally:
+                pdf.close()
+    return len(PdfReader(BytesIO(pdf_bytes)).pages)
+
+def extract_pages(pdf_bytes: bytes, start: int = 0, stop: int | None = None) -> str:
+    """
+    Extrae el texto de un rango de páginas de un PDF, una página por bloque.
+    Usa PDFium (código nativo) si está instalado; si no, PyPDF2.
+
+    :param pdf_bytes: Contenido binario del archivo PDF
+    :param start: Índice de la primera página (incluida)
+    :param stop: Índice de la última página (excluida); None hasta el final
+    :return: Texto de las páginas del rango unido por saltos de línea
+    """
+    if pdfium is not None:
+        with _pdfium_lock:
+            pdf = pdfium.PdfDocument(pdf_bytes)
+            try:
+                pages = []
+                for page_num in range(start, len(pdf) if stop is None else stop):
+                    page = pdf[page_num]
+                    textpage = page.get_textpage()
+                    pages.append(textpage.get_text_range())
+                    textpage.close()
+                    page.close()
+                return "\n".join(pages)
+            finally:
+                pdf.close()
+
+    reader = PdfReader(BytesIO(pdf_bytes))
+    return "\n".join(page.extract_text() or "" for page in reader.pages[start:stop])
@@ -1,44 +1,280 @@
+import asyncio
 import boto3
+import concurrent.futures
+import functools
+import hashlib
+import importlib.util
 import json
 import logging
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Optional, Dict, List, Any, Union, Tuple
+from typing import Optional, Callable, Dict, AsyncIterator, Iterator, List, Any, Union, Tuple
+from datetime import datetime
 import io
 import mimetypes
+import os
+import re
+import types
+import urllib.parse
 from pathlib import Path
 
-logging.basicConfig(level=logging.INFO)
+from cache_helper import TTLCache
+
+try:
+    import orjson
+
+    def _dumps(data: Any) -> str:
+        """Serialize a payload to a JSON string (orjson when available)."""
+        return orjson.dumps(data).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data: Any) -> str:
+        """Serialize a payload to a JSON string (orjson when available)."""
+        return json.dumps(data)
+
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Connection pool sized for the shared executor, keep-alive sockets, bounded
+# timeouts and adaptive (throttle-aware) retries for every S3 client created
+# by this module
+_CONFIG = Config(
+    max_pool_connections=64,
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=60,
+)
+
+# S3 accepts at most 1000 keys per DeleteObjects request
+_DELETE_BATCH_SIZE = 1000
+
+# Objects at or below this size are not worth splitting into ranged GETs
+_PARALLEL_DOWNLOAD_MIN_SIZE = 100 * 1024 * 1024
+
+# Route requests through the bucket's Transfer Acceleration edge endpoint
+_ACCELERATE_CONFIG = Config(s3={'use_accelerate_endpoint': True, 'addressing_style': 'virtual'})
+
+# put_object hands bodies above this size to the managed multipart transfer
+_STREAMING_PUT_MIN_SIZE = 64 * 1024 * 1024
+
+# Prefix of the secondary copy written by put_object_doublewrite
+MIRROR_PREFIX = "_mirror/"
+
+# Read-only stand-in for omitted extra_args; copied only when a key is added
+_EMPTY_EXTRA: types.MappingProxyType = types.MappingProxyType({})
+
+# Existence results are reused briefly to absorb repeated polling of hot keys
+_EXISTS_CACHE_TTL = 60
+
+# Copies above this size are split into concurrent UploadPartCopy requests
+_MULTIPART_COPY_MIN_SIZE = 100 * 1024 * 1024
+_COPY_PART_SIZE = 16 * 1024 * 1024
+_COPY_PART_WORKERS = 16
+
+# Object attributes CopyObject carries over by default and a multipart copy must set explicitly
+_COPIED_ATTRIBUTES = (
+    'CacheControl', 'ContentDisposition', 'ContentEncoding', 'ContentLanguage',
+    'ContentType', 'Expires', 'Metadata',
+)
+
+# Source preconditions, forwarded to every UploadPartCopy of a multipart copy
+_COPY_SOURCE_CONDITIONS = frozenset({
+    'CopySourceIfMatch', 'CopySourceIfModifiedSince', 'CopySourceIfNoneMatch',
+    'CopySourceIfUnmodifiedSince',
+})
+
+# CopyObject-only arguments that CreateMultipartUpload rejects
+_COPY_ONLY_ARGS = frozenset({'MetadataDirective', 'TaggingDirective'}) | _COPY_SOURCE_CONDITIONS
+
+# Concurrent directory listings per list_objects_recursively call
+_LIST_WORKERS = 32
+
+# Shared pool for concurrent S3 requests, reused across calls and helpers
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=16)
+
+
+@functools.lru_cache(maxsize=1024)
+def _guess_ct(ext: str) -> Optional[str]:
+    """Return the MIME type for a lowercase file extension, memoized per extension."""
+    content_type, _ = mimetypes.guess_type(f"file{ext}")
+    return content_type
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compile a key_pattern regex, memoized across listings."""
+    return re.compile(pattern)
+
+
+def _s3_call(operation: str, key_index: Optional[int] = 0) -> Callable:
+    """
+    Log ClientErrors raised by an S3Helper method and re-raise them.
+
+    An error is logged once even when it propagates through several decorated
+    methods (e.g. put_object delegating to upload_fileobj).
+
+    :param operation: Operation name used in the log message.
+    :param key_index: Position of the object key argument (None if the method takes no key).
+    :return: Decorator for S3Helper methods.
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self: "S3Helper", *args: Any, **kwargs: Any) -> Any:
+            try:
+                return method(self, *args, **kwargs)
+            except ClientError as error:
+                if not getattr(error, '_s3_logged', False):
+                    error._s3_logged = True
+                    target = kwargs.get('object_key')
+                    if target is None and key_index is not None and len(args) > key_index:
+                        target = args[key_index]
+                    logger.error(
+                        "Failed to %s - Bucket: %s | Key: %s | Error: %s | Message: %s",
+                        operation, self.bucket_name, target,
+                        error.response['Error']['Code'], error.response['Error']['Message']
+                    )
+                raise
+        return wrapper
+    return decorator
+
+
+def _compile_filters(filters: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Compile filter criteria into a predicate over object metadata.
+
+    Extensions, dates and patterns are parsed once here instead of per object.
+
+    :param filters: Filter criteria ('extension', 'min_size', 'max_size', 'date_range', 'key_pattern').
+    :return: Function returning True if an object passes all filters.
+    """
+    extension = f".{filters['extension'].lower()}" if 'extension' in filters else None
+    min_size = filters.get('min_size')
+    max_size = filters.get('max_size')
+    date_range = filters.get('date_range') or {}
+    start_date = datetime.fromisoformat(date_range['start']).date() if date_range.get('start') else None
+    end_date = datetime.fromisoformat(date_range['end']).date() if date_range.get('end') else None
+    search = _compile_pattern(filters['key_pattern']).search if 'key_pattern' in filters else None
+
+    def predicate(obj: Dict[str, Any]) -> bool:
+        key = obj.get('Key', '')
+        size = obj.get('Size', 0)
+        last_modified = obj.get('LastModified')
+        return (
+            (extension is None or key.lower().endswith(extension))
+            and (min_size is None or size >= min_size)
+            and (max_size is None or size <= max_size)
+            and (last_modified is None or start_date is None or last_modified.date() >= start_date)
+            and (last_modified is None or end_date is None or last_modified.date() <= end_date)
+            and (search is None or search(key) is not None)
+        )
+
+    return predicate
+
+
 class S3Helper:
     """Custom helper for S3 to simplify file operations."""
 
+    __slots__ = (
+        "bucket_name",
+        "s3_client",
+        "_boto_cfg",
+        "_transfer_cfg",
+        "_crt_manager",
+        "_s3_url_prefix",
+        "_exists_cache",
+        "_policy_cache",
+    )
+
     def __init__(
         self,
         bucket_name: str,
         region_name: Optional[str] = None,
+        use_crt: bool = False,
+        use_accelerate: bool = False,
+        detect_accelerate: bool = False,
     ) -> None:
         """
         Initialize the S3 helper.
 
         :param bucket_name: Name of the S3 bucket.
         :param region_name: AWS region (optional, defaults to boto3 default).
+        :param use_crt: Route upload_file/download_file and the fileobj variants
+            through the AWS Common Runtime transfer manager, which runs outside
+            the GIL and suits multi-GB transfers (requires ``boto3[crt]``).
+            Raises if the CRT manager cannot be created for this client.
+        :param use_accelerate: Send every request through S3 Transfer Acceleration;
+            only worthwhile for callers far from the bucket's region.
+        :param detect_accelerate: Enable acceleration automatically when the
+            bucket has it turned on.
         """
         self.bucket_name = bucket_name
-        self.s3_client = boto3.client("s3", region_name=region_name)
-        self.s3_resource = boto3.resource("s3", region_name=region_name)
-        self.bucket = self.s3_resource.Bucket(bucket_name)
+        self._s3_url_prefix = f"s3://{bucket_name}/"
+        self._exists_cache = TTLCache(maxsize=4096, ttl=_EXISTS_CACHE_TTL)
+        # (policy digest, parsed policy) of the last policy fetched
+        self._policy_cache: Optional[Tuple[bytes, Dict[str, Any]]] = None
+        # Created from the default session so setup_default_session profiles apply
+        self._boto_cfg = _CONFIG
+        self.s3_client = boto3.client("s3", region_name=region_name, config=self._boto_cfg)
+        if use_crt:
+            if importlib.util.find_spec("awscrt") is None:
+                raise ImportError("use_crt=True requires the CRT extra: pip install 'boto3[crt]'")
+            # CRT splits transfers itself and prefers 8 MiB parts
+            self._transfer_cfg = TransferConfig(
+                multipart_threshold=8 * 1024 * 1024,
+                multipart_chunksize=8 * 1024 * 1024,
+            )
+        else:
+            # Multipart transfers with 64 MiB parts uploaded/downloaded in parallel
+            self._transfer_cfg = TransferConfig(
+                multipart_threshold=8 * 1024 * 1024,
+                multipart_chunksize=64 * 1024 * 1024,
+                max_concurrency=10,
+                use_threads=True,
+                max_io_queue=1000,
+            )
         self._validate_bucket()
-        logger.info(f"Configured helper for S3 bucket: {bucket_name}")
+        if use_accelerate or (detect_accelerate and self._accelerate_enabled()):
+            self._boto_cfg = _CONFIG.merge(_ACCELERATE_CONFIG)
+            self.s3_client = boto3.client("s3", region_name=region_name, config=self._boto_cfg)
+            logger.info("Using S3 Transfer Acceleration for bucket: %s", bucket_name)
+        self._crt_manager = None
+        if use_crt:
+            # Built explicitly: boto3's preferred_transfer_client only picks CRT
+            # automatically on optimized instances and would silently fall back
+            from boto3.crt import create_crt_transfer_manager
+            self._crt_manager = create_crt_transfer_manager(self.s3_client, self._transfer_cfg)
+            if self._crt_manager is None:
+                raise RuntimeError(
+                    "use_crt=True but the CRT transfer manager is unavailable for this client "
+                    "(incompatible credentials or CRT client already in use by another process)"
+                )
+        logger.info("Configured helper for S3 bucket: %s", bucket_name)
 
     def _validate_bucket(self) -> None:
         """Validate that the bucket exists and is accessible"""
         try:
             self.s3_client.head_bucket(Bucket=self.bucket_name)
         except ClientError as error:
-            logger.error(f"Bucket {self.bucket_name} does not exist or is inaccessible")
+            logger.error("Bucket %s does not exist or is inaccessible", self.bucket_name)
             raise error
 
+    def _accelerate_enabled(self) -> bool:
+        """Return True if Transfer Acceleration is enabled on the bucket"""
+        try:
+            response = self.s3_client.get_bucket_accelerate_configuration(Bucket=self.bucket_name)
+            return response.get('Status') == 'Enabled'
+        except ClientError as error:
+            logger.warning(
+                "Could not read accelerate configuration - Bucket: %s | Error: %s",
+                self.bucket_name, error.response['Error']['Code']
+            )
+            return False
+
+    @_s3_call("upload file", key_index=1)
     def upload_file(
         self, 
         file_path: str, 
@@ -53,35 +289,32 @@ class S3Helper:
         :param extra_args: Extra arguments to pass to upload_file.
         :return: S3 path of the uploaded file.
         """
-        s3_path = f"s3://{self.bucket_name}/{object_key}"
-        logger.info(f"Uploading file to S3: {s3_path}")
+        s3_path = self._s3_url_prefix + object_key
+        logger.info("Uploading file to S3: %s", s3_path)
         
-        try:
-            # Set content type if not provided
-            if extra_args is None:
-                extra_args = {}
-            
-            if 'ContentType' not in extra_args:
-                content_type, _ = mimetypes.guess_type(file_path)
-                if content_type:
-                    extra_args['ContentType'] = content_type
-            
+        # Set content type if not provided
+        extra_args = extra_args or _EMPTY_EXTRA
+        
+        if 'ContentType' not in extra_args:
+            content_type = _guess_ct(Path(file_path).suffix.lower())
+            if content_type:
+                extra_args = {**extra_args, 'ContentType': content_type}
+        
+        if self._crt_manager is not None:
+            self._crt_manager.upload(file_path, self.bucket_name, object_key, extra_args or None).result()
+        else:
             self.s3_client.upload_file(
                 file_path,
                 self.bucket_name,
                 object_key,
-                ExtraArgs=extra_args
-            )
-            logger.info(f"File uploaded successfully: {s3_path}")
-            return s3_path
-        except ClientError as error:
-            logger.error(
-                f"Failed to upload file - Bucket: {self.bucket_name} | Key: {object_key} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
+                ExtraArgs=extra_args or None,
+                Config=self._transfer_cfg
             )
-            raise error
+        self._exists_cache.pop(object_key)
+        logger.info("File uploaded successfully: %s", s3_path)
+        return s3_path
 
+    @_s3_call("upload file object", key_index=1)
     def upload_fileobj(
         self,
         fileobj,
@@ -96,26 +329,57 @@ class S3Helper:
         :param extra_args: Extra arguments to pass to upload_fileobj.
         :return: S3 path of the uploaded file.
         """
-        s3_path = f"s3://{self.bucket_name}/{object_key}"
-        logger.info(f"Uploading file object to S3: {s3_path}")
+        s3_path = self._s3_url_prefix + object_key
+        logger.info("Uploading file object to S3: %s", s3_path)
         
-        try:
+        if self._crt_manager is not None:
+            self._crt_manager.upload(fileobj, self.bucket_name, object_key, extra_args).result()
+        else:
             self.s3_client.upload_fileobj(
                 fileobj,
                 self.bucket_name,
                 object_key,
-                ExtraArgs=extra_args
+                ExtraArgs=extra_args,
+                Config=self._transfer_cfg
             )
-            logger.info(f"File object uploaded successfully: {s3_path}")
-            return s3_path
-        except ClientError as error:
-            logger.error(
-                f"Failed to upload file object - Bucket: {self.bucket_name} | Key: {object_key} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
-            )
-            raise error
+        self._exists_cache.pop(object_key)
+        logger.info("File object uploaded successfully: %s", s3_path)
+        return s3_path
+
+    def upload_files(
+        self,
+        pairs: List[Tuple[str, str]],
+        max_workers: int = 32
+    ) -> List[str]:
+        """
+        Upload many local files to S3 concurrently.
+
+        Every upload shares this helper's client; the worker count is capped at
+        the client's connection pool size so HTTPS connections are reused.
+
+        :param pairs: List of (file_path, object_key) tuples.
+        :param max_workers: Maximum number of concurrent uploads.
+        :return: S3 paths of the uploaded files, in the same order as pairs.
+        """
+        logger.info("Uploading %s files to S3", len(pairs))
+        
+        if not pairs:
+            return []
+        
+        workers = min(max_workers, self._boto_cfg.max_pool_connections, len(pairs))
+        s3_paths: List[str] = [''] * len(pairs)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.upload_file, file_path, object_key): index
+                for index, (file_path, object_key) in enumerate(pairs)
+            }
+            for future in concurrent.futures.as_completed(futures):
+                s3_paths[futures[future]] = future.result()
+        
+        logger.info("Successfully uploaded %s files", len(s3_paths))
+        return s3_paths
 
+    @_s3_call("download file")
     def download_file(
         self,
         object_key: str,
@@ -129,24 +393,88 @@ class S3Helper:
         :param file_path: Local path to save the file.
         :param extra_args: Extra arguments to pass to download_file.
         """
-        logger.info(f"Downloading file from S3: s3://{self.bucket_name}/{object_key}")
+        logger.info("Downloading file from S3: %s%s", self._s3_url_prefix, object_key)
         
-        try:
+        if self._crt_manager is not None:
+            self._crt_manager.download(self.bucket_name, object_key, file_path, extra_args).result()
+        else:
             self.s3_client.download_file(
                 self.bucket_name,
                 object_key,
                 file_path,
-                ExtraArgs=extra_args
+                ExtraArgs=extra_args,
+                Config=self._transfer_cfg
             )
-            logger.info(f"File downloaded successfully to: {file_path}")
-        except ClientError as error:
-            logger.error(
-                f"Failed to download file - Bucket: {self.bucket_name} | Key: {object_key} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
-            )
-            raise error
+        logger.info("File downloaded successfully to: %s", file_path)
+
+    def download_file_parallel(
+        self,
+        object_key: str,
+        file_path: str,
+        part_size: int = 16 * 1024 * 1024,
+        concurrency: int = 16
+    ) -> None:
+        """
+        Download a large object with concurrent ranged GETs.
+
+        Each range is written straight into its offset of a preallocated file.
+        Objects of 100 MB or less, or platforms without os.pwrite, fall back to
+        download_file.
+
+        :param object_key: Key name in S3.
+        :param file_path: Local path to save the file.
+        :param part_size: Size in bytes of each ranged GET.
+        :param concurrency: Maximum number of concurrent ranged GETs.
+        """
+        metadata = self.get_object_metadata(object_key)
+        size, etag = metadata['ContentLength'], metadata['ETag']
+        if size <= _PARALLEL_DOWNLOAD_MIN_SIZE or not hasattr(os, 'pwrite'):
+            self.download_file(object_key, file_path)
+            return
+        
+        ranges = [
+            (start, min(start + part_size, size) - 1)
+            for start in range(0, size, part_size)
+        ]
+        logger.info(
+            "Downloading file from S3 in %s parts: %s%s",
+            len(ranges), self._s3_url_prefix, object_key
+        )
+        
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(fd, 0, size)
+            else:
+                os.ftruncate(fd, size)
+            
+            def fetch(start: int, end: int) -> None:
+                # Pinned to the ETag read above: an overwrite mid-download fails
+                # with 412 instead of mixing ranges from two versions
+                data = memoryview(self.get_object_range(object_key, start, end, if_match=etag))
+                offset = start
+                while data:
+                    written = os.pwrite(fd, data, offset)
+                    data = data[written:]
+                    offset += written
+            
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(concurrency, len(ranges))) as executor:
+                futures = [executor.submit(fetch, start, end) for start, end in ranges]
+                try:
+                    for future in futures:
+                        future.result()
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        except Exception:
+            os.close(fd)
+            os.remove(file_path)
+            raise
+        os.close(fd)
+        logger.info("File downloaded successfully to: %s", file_path)
 
+    @_s3_call("download file object")
     def download_fileobj(
         self,
         object_key: str,
@@ -160,48 +488,129 @@ class S3Helper:
         :param fileobj: File-like object to write to.
         :param extra_args: Extra arguments to pass to download_fileobj.
         """
-        logger.info(f"Downloading file object from S3: s3://{self.bucket_name}/{object_key}")
+        logger.info("Downloading file object from S3: %s%s", self._s3_url_prefix, object_key)
         
-        try:
+        if self._crt_manager is not None:
+            self._crt_manager.download(self.bucket_name, object_key, fileobj, extra_args).result()
+        else:
             self.s3_client.download_fileobj(
                 self.bucket_name,
                 object_key,
                 fileobj,
-                ExtraArgs=extra_args
+                ExtraArgs=extra_args,
+                Config=self._transfer_cfg
             )
-            logger.info(f"File object downloaded successfully")
-        except ClientError as error:
-            logger.error(
-                f"Failed to download file object - Bucket: {self.bucket_name} | Key: {object_key} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
-            )
-            raise error
+        logger.info("File object downloaded successfully")
 
-    def get_object(self, object_key: str) -> Dict[str, Any]:
+    @_s3_call("get object")
+    def get_object(
+        self,
+        object_key: str,
+        byte_range: Optional[Tuple[int, int]] = None
+    ) -> Dict[str, Any]:
         """
         Get object content and metadata.
 
         :param object_key: Key name in S3.
+        :param byte_range: Inclusive (start, end) byte offsets to fetch (None for the whole object).
         :return: Object content and metadata.
         """
-        logger.info(f"Getting object from S3: s3://{self.bucket_name}/{object_key}")
+        logger.info("Getting object from S3: %s%s", self._s3_url_prefix, object_key)
         
+        get_args = {'Bucket': self.bucket_name, 'Key': object_key}
+        if byte_range is not None:
+            get_args['Range'] = f"bytes={byte_range[0]}-{byte_range[1]}"
+        response = self.s3_client.get_object(**get_args)
+        logger.info("Object retrieved successfully")
+        return response
+
+    def iter_object(self, object_key: str, chunk_size: int = 8 * 1024 * 1024) -> Iterator[bytes]:
+        """
+        Stream object content in chunks instead of reading it into memory at once.
+
+        :param object_key: Key name in S3.
+        :param chunk_size: Size in bytes of each yielded chunk.
+        :return: Iterator over the object's content chunks.
+        """
+        body = self.get_object(object_key)['Body']
         try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
+
+    @_s3_call("get object range")
+    def get_object_range(
+        self,
+        object_key: str,
+        start: int,
+        end: int,
+        if_match: Optional[str] = None
+    ) -> bytes:
+        """
+        Get a byte range of an object.
+
+        :param object_key: Key name in S3.
+        :param start: First byte offset (inclusive).
+        :param end: Last byte offset (inclusive).
+        :param if_match: ETag the object must still have; S3 answers 412 otherwise.
+        :return: Content of the requested range.
+        """
+        logger.debug("Getting bytes %s-%s of object: %s%s", start, end, self._s3_url_prefix, object_key)
+        
+        conditions = {'IfMatch': if_match} if if_match else _EMPTY_EXTRA
+        response = self.s3_client.get_object(
+            Bucket=self.bucket_name,
+            Key=object_key,
+            Range=f"bytes={start}-{end}",
+            **conditions
+        )
+        return response['Body'].read()
+
+    @_s3_call("get object in parallel")
+    def get_object_parallel(
+        self,
+        object_key: str,
+        part_size: int = 8 * 1024 * 1024,
+        concurrency: int = 8,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """
+        Get the whole content of an object with concurrent ranged GETs.
+
+        Every range is requested with IfMatch on the ETag read up front, so an
+        object overwritten mid-download fails instead of mixing versions.
+
+        :param object_key: Key name in S3.
+        :param part_size: Size in bytes of each ranged GET.
+        :param concurrency: Maximum number of concurrent ranged GETs.
+        :param metadata: Object metadata already fetched (see get_object_metadata), to skip the HEAD request.
+        :return: Object content.
+        """
+        if metadata is None:
+            metadata = self.s3_client.head_object(Bucket=self.bucket_name, Key=object_key)
+        size, etag = metadata['ContentLength'], metadata['ETag']
+        if size == 0:
+            return b""
+        
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+        logger.info(
+            "Getting object from S3 in %s parts: %s%s",
+            len(ranges), self._s3_url_prefix, object_key
+        )
+        
+        def fetch(byte_range: Tuple[int, int]) -> bytes:
             response = self.s3_client.get_object(
                 Bucket=self.bucket_name,
-                Key=object_key
-            )
-            logger.info("Object retrieved successfully")
-            return response
-        except ClientError as error:
-            logger.error(
-                f"Failed to get object - Bucket: {self.bucket_name} | Key: {object_key} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
+                Key=object_key,
+                Range=f"bytes={byte_range[0]}-{byte_range[1]}",
+                IfMatch=etag
             )
-            raise error
+            return response['Body'].read()
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(concurrency, len(ranges))) as executor:
+            return b"".join(executor.map(fetch, ranges))
 
+    @_s3_call("put object")
     def put_object(
         self,
         object_key: str,
@@ -211,89 +620,132 @@ class S3Helper:
         """
         Put object content to S3.
 
+        File-like bodies and bytes larger than 64 MiB are streamed through
+        upload_fileobj, which switches to a parallel multipart upload past the
+        transfer threshold; extra_args must then be valid upload ExtraArgs.
+
         :param object_key: Key name in S3.
         :param body: Content to upload.
         :param extra_args: Extra arguments to pass to put_object.
         :return: S3 path of the uploaded object.
         """
-        s3_path = f"s3://{self.bucket_name}/{object_key}"
-        logger.info(f"Putting object to S3: {s3_path}")
+        if hasattr(body, 'read') or (
+            isinstance(body, (bytes, bytearray)) and len(body) > _STREAMING_PUT_MIN_SIZE
+        ):
+            if not hasattr(body, 'read'):
+                body = io.BytesIO(body)
+            return self.upload_fileobj(body, object_key, extra_args=dict(extra_args) if extra_args else None)
         
-        try:
-            put_args = {
-                'Bucket': self.bucket_name,
-                'Key': object_key,
-                'Body': body
-            }
-            
-            if extra_args:
-                put_args.update(extra_args)
-            
-            self.s3_client.put_object(**put_args)
-            logger.info(f"Object put successfully: {s3_path}")
-            return s3_path
-        except ClientError as error:
-            logger.error(
-                f"Failed to put object - Bucket: {self.bucket_name} | Key: {object_key} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
-            )
-            raise error
+        s3_path = self._s3_url_prefix + object_key
+        logger.info("Putting object to S3: %s", s3_path)
+        
+        put_args = {
+            'Bucket': self.bucket_name,
+            'Key': object_key,
+            'Body': body,
+            **(extra_args or _EMPTY_EXTRA)
+        }
+        
+        self.s3_client.put_object(**put_args)
+        self._exists_cache.pop(object_key)
+        logger.info("Object put successfully: %s", s3_path)
+        return s3_path
+
+    def put_object_doublewrite(
+        self,
+        object_key: str,
+        body: Union[str, bytes, io.IOBase],
+        extra_args: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Put object content under its key and under a mirror key concurrently.
+
+        Readers can fall back to the mirror key (MIRROR_PREFIX + key) when a
+        freshly written object is not yet visible under the primary key.
+        File-like bodies are read into memory once so both uploads can use them.
+
+        :param object_key: Key name in S3.
+        :param body: Content to upload.
+        :param extra_args: Extra arguments to pass to put_object.
+        :return: S3 path of the primary object.
+        """
+        if hasattr(body, 'read'):
+            body = body.read()
+        
+        futures = [
+            _EXECUTOR.submit(self.put_object, key, body, extra_args)
+            for key in (object_key, MIRROR_PREFIX + object_key)
+        ]
+        return [future.result() for future in futures][0]
 
+    @_s3_call("delete object")
     def delete_object(self, object_key: str) -> None:
         """
         Delete an object from S3.
 
         :param object_key: Key name in S3.
         """
-        logger.info(f"Deleting object from S3: s3://{self.bucket_name}/{object_key}")
+        logger.info("Deleting object from S3: %s%s", self._s3_url_prefix, object_key)
         
-        try:
-            self.s3_client.delete_object(
-                Bucket=self.bucket_name,
-                Key=object_key
-            )
-            logger.info("Object deleted successfully")
-        except ClientError as error:
-            logger.error(
-                f"Failed to delete object - Bucket: {self.bucket_name} | Key: {object_key} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
-            )
-            raise error
+        self.s3_client.delete_object(
+            Bucket=self.bucket_name,
+            Key=object_key
+        )
+        self._exists_cache.pop(object_key)
+        logger.info("Object deleted successfully")
 
+    @_s3_call("delete objects", key_index=None)
     def delete_objects(self, object_keys: List[str]) -> Dict[str, Any]:
         """
         Delete multiple objects from S3.
 
+        Keys are sent in concurrent DeleteObjects requests of up to 1000 keys
+        (the S3 limit per request).
+
         :param object_keys: List of key names in S3.
-        :return: Response from delete_objects call.
+        :return: Dict with the aggregated 'Deleted' and 'Errors' lists.
         """
-        logger.info(f"Deleting {len(object_keys)} objects from S3")
+        logger.info("Deleting %s objects from S3", len(object_keys))
         
-        try:
-            objects = [{'Key': key} for key in object_keys]
-            response = self.s3_client.delete_objects(
-                Bucket=self.bucket_name,
-                Delete={'Objects': objects}
-            )
-            
-            deleted = response.get('Deleted', [])
-            errors = response.get('Errors', [])
-            
-            logger.info(f"Successfully deleted {len(deleted)} objects")
-            if errors:
-                logger.warning(f"Failed to delete {len(errors)} objects")
-            
-            return response
-        except ClientError as error:
-            logger.error(
-                f"Failed to delete objects - Bucket: {self.bucket_name} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
-            )
-            raise error
+        futures = [
+            _EXECUTOR.submit(self._delete_objects_chunk, object_keys[i:i + _DELETE_BATCH_SIZE])
+            for i in range(0, len(object_keys), _DELETE_BATCH_SIZE)
+        ]
+        deleted = []
+        errors = []
+        for future in concurrent.futures.as_completed(futures):
+            chunk_deleted, chunk_errors = future.result()
+            deleted.extend(chunk_deleted)
+            errors.extend(chunk_errors)
+        
+        logger.info("Successfully deleted %s objects", len(deleted))
+        if errors:
+            logger.warning("Failed to delete %s objects", len(errors))
+        
+        return {'Deleted': deleted, 'Errors': errors}
 
+    def _delete_objects_chunk(self, object_keys: List[str]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Delete up to 1000 objects in a single quiet DeleteObjects request.
+
+        Quiet mode only reports failures, so the deleted list is rebuilt from
+        the keys that did not fail.
+
+        :param object_keys: List of key names in S3 (at most 1000).
+        :return: Tuple of (deleted, errors) entries.
+        """
+        response = self.s3_client.delete_objects(
+            Bucket=self.bucket_name,
+            Delete={'Objects': [{'Key': key} for key in object_keys], 'Quiet': True}
+        )
+        for key in object_keys:
+            self._exists_cache.pop(key)
+        errors = response.get('Errors', [])
+        failed = {error['Key'] for error in errors}
+        deleted = [{'Key': key} for key in object_keys if key not in failed]
+        return deleted, errors
+
+    @_s3_call("copy object")
     def copy_object(
         self,
         source_key: str,
@@ -304,6 +756,9 @@ class S3Helper:
         """
         Copy an object within S3.
 
+        Sources larger than 100 MiB are copied as a multipart upload whose
+        16 MiB parts are copied concurrently inside S3.
+
         :param source_key: Source object key.
         :param destination_key: Destination object key.
         :param source_bucket: Source bucket (defaults to current bucket).
@@ -312,54 +767,229 @@ class S3Helper:
         """
         source_bucket = source_bucket or self.bucket_name
         source = f"{source_bucket}/{source_key}"
-        destination_path = f"s3://{self.bucket_name}/{destination_key}"
+        destination_path = self._s3_url_prefix + destination_key
         
-        logger.info(f"Copying object from {source} to {destination_path}")
+        logger.info("Copying object from %s to %s", source, destination_path)
         
-        try:
+        head = self.s3_client.head_object(Bucket=source_bucket, Key=source_key)
+        if head['ContentLength'] > _MULTIPART_COPY_MIN_SIZE:
+            self._multipart_copy(source, head, destination_key, extra_args or _EMPTY_EXTRA)
+        else:
             copy_args = {
                 'CopySource': source,
                 'Bucket': self.bucket_name,
-                'Key': destination_key
+                'Key': destination_key,
+                **(extra_args or _EMPTY_EXTRA)
             }
-            
-            if extra_args:
-                copy_args.update(extra_args)
-            
             self.s3_client.copy_object(**copy_args)
-            logger.info("Object copied successfully")
-            return destination_path
-        except ClientError as error:
-            logger.error(
-                f"Failed to copy object - Source: {source} | Destination: {destination_path} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
+        self._exists_cache.pop(destination_key)
+        logger.info("Object copied successfully")
+        return destination_path
+
+    def _multipart_copy(
+        self,
+        source: str,
+        head: Dict[str, Any],
+        destination_key: str,
+        extra_args: Dict[str, Any]
+    ) -> None:
+        """
+        Copy a large object with concurrent UploadPartCopy requests.
+
+        The source's content headers and metadata are carried over unless
+        extra_args sets MetadataDirective to REPLACE, and its tags unless
+        TaggingDirective is REPLACE, as CopyObject does. Every part is pinned to
+        the source ETag from head (plus any CopySourceIf* in extra_args), so a
+        source overwritten mid-copy fails the copy instead of mixing versions.
+        The upload is aborted if any part fails.
+
+        :param source: Source in "bucket/key" form.
+        :param head: head_object response of the source.
+        :param destination_key: Destination object key.
+        :param extra_args: Extra arguments given to copy_object.
+        """
+        create_args = {}
+        if extra_args.get('MetadataDirective') != 'REPLACE':
+            create_args = {name: head[name] for name in _COPIED_ATTRIBUTES if name in head}
+        create_args.update(
+            (name, value) for name, value in extra_args.items() if name not in _COPY_ONLY_ARGS
+        )
+        if extra_args.get('TaggingDirective') != 'REPLACE':
+            source_bucket, source_key = source.split("/", 1)
+            tags = self.s3_client.get_object_tagging(Bucket=source_bucket, Key=source_key)['TagSet']
+            if tags:
+                create_args['Tagging'] = urllib.parse.urlencode(
+                    [(tag['Key'], tag['Value']) for tag in tags]
+                )
+            else:
+                create_args.pop('Tagging', None)
+        
+        conditions = {'CopySourceIfMatch': head['ETag']}
+        conditions.update(
+            (name, value) for name, value in extra_args.items() if name in _COPY_SOURCE_CONDITIONS
+        )
+        
+        size = head['ContentLength']
+        ranges = [
+            (start, min(start + _COPY_PART_SIZE, size) - 1)
+            for start in range(0, size, _COPY_PART_SIZE)
+        ]
+        upload_id = self.s3_client.create_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=destination_key,
+            **create_args
+        )['UploadId']
+        logger.debug("Copying %s parts into %s (upload %s)", len(ranges), destination_key, upload_id)
+        
+        def copy_part(part_number: int, start: int, end: int) -> Dict[str, Any]:
+            response = self.s3_client.upload_part_copy(
+                Bucket=self.bucket_name,
+                Key=destination_key,
+                CopySource=source,
+                CopySourceRange=f"bytes={start}-{end}",
+                PartNumber=part_number,
+                UploadId=upload_id,
+                **conditions
             )
-            raise error
+            return {'ETag': response['CopyPartResult']['ETag'], 'PartNumber': part_number}
+        
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=_COPY_PART_WORKERS) as executor:
+                futures = [
+                    executor.submit(copy_part, number, start, end)
+                    for number, (start, end) in enumerate(ranges, start=1)
+                ]
+                try:
+                    parts = [future.result() for future in futures]
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+                    raise
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=destination_key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts}
+            )
+        except Exception:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=destination_key,
+                UploadId=upload_id
+            )
+            raise
+
+    def copy_objects(
+        self,
+        pairs: List[Tuple[str, str]],
+        source_bucket: Optional[str] = None,
+        max_workers: int = 16
+    ) -> List[str]:
+        """
+        Copy many objects concurrently.
+
+        :param pairs: List of (source_key, destination_key) tuples.
+        :param source_bucket: Source bucket (defaults to current bucket).
+        :param max_workers: Maximum number of concurrent copies.
+        :return: S3 paths of the copied objects, in the same order as pairs.
+        """
+        logger.info("Copying %s objects", len(pairs))
+        
+        if not pairs:
+            return []
+        
+        destination_paths: List[str] = [''] * len(pairs)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+            futures = {
+                executor.submit(self.copy_object, source_key, destination_key, source_bucket): index
+                for index, (source_key, destination_key) in enumerate(pairs)
+            }
+            for future in concurrent.futures.as_completed(futures):
+                destination_paths[futures[future]] = future.result()
+        
+        logger.info("Successfully copied %s objects", len(destination_paths))
+        return destination_paths
 
     def object_exists(self, object_key: str) -> bool:
         """
         Check if an object exists.
 
+        Results are cached briefly and invalidated when this helper writes or
+        deletes the key.
+
         :param object_key: Key name in S3.
         :return: True if object exists, False otherwise.
         """
+        cached = self._exists_cache.get(object_key)
+        if cached is not None:
+            return cached
+        
         try:
             self.s3_client.head_object(
                 Bucket=self.bucket_name,
                 Key=object_key
             )
-            return True
+            exists = True
         except ClientError as error:
             if error.response['Error']['Code'] == '404':
-                return False
+                exists = False
             else:
                 logger.error(
-                    f"Error checking object existence - Bucket: {self.bucket_name} | Key: {object_key} | "
-                    f"Error: {error.response['Error']['Code']}"
+                    "Error checking object existence - Bucket: %s | Key: %s | "
+                    "Error: %s",
+                    self.bucket_name, object_key, error.response['Error']['Code']
                 )
                 raise error
+        self._exists_cache.set(object_key, exists)
+        return exists
+
+    def objects_exist(self, object_keys: List[str]) -> Dict[str, bool]:
+        """
+        Check the existence of many objects with as few requests as possible.
+
+        Keys sharing a parent directory are resolved with one listing of that
+        directory; keys alone in their directory fall back to head_object.
 
+        :param object_keys: List of key names in S3.
+        :return: Dict mapping each key to whether it exists.
+        """
+        results: Dict[str, bool] = {}
+        groups: Dict[str, List[str]] = {}
+        for key in object_keys:
+            cached = self._exists_cache.get(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                parent = key[:key.rfind('/') + 1]
+                groups.setdefault(parent, []).append(key)
+        
+        singles = [keys[0] for keys in groups.values() if len(set(keys)) == 1]
+        listed = [(parent, set(keys)) for parent, keys in groups.items() if len(set(keys)) > 1]
+        logger.info(
+            "Checking existence of %s objects with "
+            "%s listings and %s head requests",
+            len(object_keys), len(listed), len(singles)
+        )
+        
+        for parent, wanted in listed:
+            last_key = max(wanted)
+            found = set()
+            # Listings are sorted by key, so stop once past the last wanted key
+            for obj in self._iter_objects(prefix=parent, delimiter='/'):
+                if obj['Key'] > last_key:
+                    break
+                if obj['Key'] in wanted:
+                    found.add(obj['Key'])
+            for key in wanted:
+                results[key] = key in found
+                self._exists_cache.set(key, results[key])
+        
+        for key in singles:
+            results[key] = self.object_exists(key)
+        
+        return results
+
+    @_s3_call("get object metadata")
     def get_object_metadata(self, object_key: str) -> Dict[str, Any]:
         """
         Get object metadata without downloading the content.
@@ -367,28 +997,21 @@ class S3Helper:
         :param object_key: Key name in S3.
         :return: Object metadata.
         """
-        logger.info(f"Getting metadata for object: s3://{self.bucket_name}/{object_key}")
+        logger.info("Getting metadata for object: %s%s", self._s3_url_prefix, object_key)
         
-        try:
-            response = self.s3_client.head_object(
-                Bucket=self.bucket_name,
-                Key=object_key
-            )
-            
-            # Remove the ResponseMetadata
-            metadata = dict(response)
-            metadata.pop('ResponseMetadata', None)
-            
-            logger.info("Object metadata retrieved successfully")
-            return metadata
-        except ClientError as error:
-            logger.error(
-                f"Failed to get object metadata - Bucket: {self.bucket_name} | Key: {object_key} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
-            )
-            raise error
+        response = self.s3_client.head_object(
+            Bucket=self.bucket_name,
+            Key=object_key
+        )
+        
+        # Remove the ResponseMetadata
+        metadata = dict(response)
+        metadata.pop('ResponseMetadata', None)
+        
+        logger.info("Object metadata retrieved successfully")
+        return metadata
 
+    @_s3_call("generate presigned URL")
     def get_presigned_url(
         self,
         object_key: str,
@@ -403,63 +1026,55 @@ class S3Helper:
         :param http_method: HTTP method (get_object, put_object, etc.).
         :return: Presigned URL.
         """
-        logger.info(f"Generating presigned URL for object: s3://{self.bucket_name}/{object_key}")
+        logger.info("Generating presigned URL for object: %s%s", self._s3_url_prefix, object_key)
         
-        try:
-            url = self.s3_client.generate_presigned_url(
-                http_method,
-                Params={
-                    'Bucket': self.bucket_name,
-                    'Key': object_key
-                },
-                ExpiresIn=expiration
-            )
-            logger.info("Presigned URL generated successfully")
-            return url
-        except ClientError as error:
-            logger.error(
-                f"Failed to generate presigned URL - Bucket: {self.bucket_name} | Key: {object_key} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
-            )
-            raise error
+        url = self.s3_client.generate_presigned_url(
+            http_method,
+            Params={
+                'Bucket': self.bucket_name,
+                'Key': object_key
+            },
+            ExpiresIn=expiration
+        )
+        logger.info("Presigned URL generated successfully")
+        return url
 
+    @_s3_call("set bucket policy", key_index=None)
     def set_bucket_policy(self, policy: Union[Dict[str, Any], str]) -> None:
         """
         Set the bucket policy.
 
         :param policy: Bucket policy as dict or JSON string.
         """
-        logger.info(f"Setting bucket policy for bucket: {self.bucket_name}")
+        logger.info("Setting bucket policy for bucket: %s", self.bucket_name)
         
-        try:
-            if isinstance(policy, dict):
-                policy = json.dumps(policy)
-            
-            self.s3_client.put_bucket_policy(
-                Bucket=self.bucket_name,
-                Policy=policy
-            )
-            logger.info("Bucket policy set successfully")
-        except ClientError as error:
-            logger.error(
-                f"Failed to set bucket policy - Bucket: {self.bucket_name} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
-            )
-            raise error
+        if isinstance(policy, dict):
+            policy = _dumps(policy)
+        
+        self.s3_client.put_bucket_policy(
+            Bucket=self.bucket_name,
+            Policy=policy
+        )
+        logger.info("Bucket policy set successfully")
 
     def get_bucket_policy(self) -> Dict[str, Any]:
         """
         Get the bucket policy.
 
+        The parsed policy is reused while the stored document is unchanged, so
+        treat the returned dict as read-only.
+
         :return: Bucket policy as dict.
         """
-        logger.info(f"Getting bucket policy for bucket: {self.bucket_name}")
+        logger.info("Getting bucket policy for bucket: %s", self.bucket_name)
         
         try:
             response = self.s3_client.get_bucket_policy(Bucket=self.bucket_name)
-            policy = json.loads(response['Policy'])
+            digest = hashlib.blake2b(response['Policy'].encode(), digest_size=8).digest()
+            if self._policy_cache is not None and self._policy_cache[0] == digest:
+                return self._policy_cache[1]
+            policy = _loads(response['Policy'])
+            self._policy_cache = (digest, policy)
             logger.info("Bucket policy retrieved successfully")
             return policy
         except ClientError as error:
@@ -468,9 +1083,11 @@ class S3Helper:
                 return {}
             else:
                 logger.error(
-                    f"Failed to get bucket policy - Bucket: {self.bucket_name} | "
-                    f"Error: {error.response['Error']['Code']} | "
-                    f"Message: {error.response['Error']['Message']}"
+                    "Failed to get bucket policy - Bucket: %s | "
+                    "Error: %s | "
+                    "Message: %s",
+                    self.bucket_name,
+                    error.response['Error']['Code'], error.response['Error']['Message']
                 )
                 raise error
                       
@@ -479,7 +1096,8 @@ class S3Helper:
         prefix: Optional[str] = None,
         delimiter: Optional[str] = None,
         max_keys: int = 1000,
-        max_pages: Optional[int] = None
+        max_pages: Optional[int] = None,
+        start_after: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         List objects in the bucket with pagination.
@@ -488,49 +1106,147 @@ class S3Helper:
         :param delimiter: Delimiter for grouping keys.
         :param max_keys: Maximum number of keys per request.
         :param max_pages: Maximum number of pages to retrieve (None for all).
+        :param start_after: Key to start listing after, to resume a previous listing.
         :return: List of object metadata.
         """
-        logger.info(f"Listing objects in bucket {self.bucket_name}")
-        all_objects = []
-        page_count = 0
+        logger.info("Listing objects in bucket %s", self.bucket_name)
+        all_objects = list(self._iter_objects(
+            prefix=prefix,
+            delimiter=delimiter,
+            max_keys=max_keys,
+            max_pages=max_pages,
+            start_after=start_after
+        ))
+        logger.info("Found %s objects", len(all_objects))
+        return all_objects
+
+    async def alist_objects(
+        self,
+        prefix: Optional[str] = None,
+        delimiter: Optional[str] = None,
+        max_keys: int = 1000,
+        max_pages: Optional[int] = None,
+        prefetch: int = 2
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Asynchronously yield object metadata, fetching pages ahead of the consumer.
+
+        Pages are requested in a worker thread and buffered in a bounded queue,
+        so the next ListObjectsV2 round trip overlaps with processing the
+        current page without blocking the event loop.
+
+        :param prefix: Prefix to filter objects.
+        :param delimiter: Delimiter for grouping keys.
+        :param max_keys: Maximum number of keys per request.
+        :param max_pages: Maximum number of pages to retrieve (None for all).
+        :param prefetch: Maximum number of pages buffered ahead of the consumer.
+        :return: Async iterator over object metadata.
+        """
+        pages = self._iter_pages(
+            prefix=prefix,
+            delimiter=delimiter,
+            max_keys=max_keys,
+            max_pages=max_pages
+        )
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(prefetch, 1))
         
+        async def produce() -> None:
+            try:
+                while True:
+                    page = await asyncio.to_thread(next, pages, None)
+                    await queue.put(page)
+                    if page is None:
+                        return
+            except Exception as error:
+                await queue.put(error)
+        
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                page = await queue.get()
+                if page is None:
+                    return
+                if isinstance(page, Exception):
+                    raise page
+                for obj in page.get('Contents', []):
+                    yield obj
+        finally:
+            producer.cancel()
+
+    def _iter_objects(
+        self,
+        prefix: Optional[str] = None,
+        delimiter: Optional[str] = None,
+        max_keys: int = 1000,
+        max_pages: Optional[int] = None,
+        start_after: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield object metadata page by page.
+
+        :param prefix: Prefix to filter objects.
+        :param delimiter: Delimiter for grouping keys.
+        :param max_keys: Maximum number of keys per request.
+        :param max_pages: Maximum number of pages to retrieve (None for all).
+        :param start_after: Key to start listing after.
+        :return: Iterator over object metadata.
+        """
+        for page in self._iter_pages(prefix, delimiter, max_keys, max_pages, start_after):
+            yield from page.get('Contents', [])
+
+    def _iter_pages(
+        self,
+        prefix: Optional[str] = None,
+        delimiter: Optional[str] = None,
+        max_keys: int = 1000,
+        max_pages: Optional[int] = None,
+        start_after: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield raw ListObjectsV2 pages.
+
+        :param prefix: Prefix to filter objects.
+        :param delimiter: Delimiter for grouping keys.
+        :param max_keys: Maximum number of keys per request.
+        :param max_pages: Maximum number of pages to retrieve (None for all).
+        :param start_after: Key to start listing after.
+        :return: Iterator over ListObjectsV2 responses.
+        """
+        kwargs = {
+            'Bucket': self.bucket_name,
+            'MaxKeys': max_keys
+        }
+        
+        if prefix:
+            kwargs['Prefix'] = prefix
+        if delimiter:
+            kwargs['Delimiter'] = delimiter
+        if start_after:
+            kwargs['StartAfter'] = start_after
+        
+        page_count = 0
         try:
-            kwargs = {
-                'Bucket': self.bucket_name,
-                'MaxKeys': max_keys
-            }
-            
-            if prefix:
-                kwargs['Prefix'] = prefix
-            if delimiter:
-                kwargs['Delimiter'] = delimiter
-            
-            # Create paginator
             paginator = self.s3_client.get_paginator('list_objects_v2')
-            pages = paginator.paginate(**kwargs)
-            
-            for page in pages:
+            for page in paginator.paginate(**kwargs):
                 page_count += 1
-                objects = page.get('Contents', [])
-                all_objects.extend(objects)
-                
-                logger.debug(f"Page {page_count}: Retrieved {len(objects)} objects")
+                logger.debug("Page %s: Retrieved %s objects", page_count, len(page.get('Contents', [])))
+                yield page
                 
                 # Check if we've reached max pages
                 if max_pages and page_count >= max_pages:
-                    logger.info(f"Reached maximum page limit of {max_pages}")
+                    logger.info("Reached maximum page limit of %s", max_pages)
                     break
-            
-            logger.info(f"Found {len(all_objects)} objects across {page_count} pages")
-            return all_objects
         except ClientError as error:
             logger.error(
-                f"Failed to list objects - Bucket: {self.bucket_name} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
+                "Failed to list objects - Bucket: %s | "
+                "Error: %s | "
+                "Message: %s",
+                self.bucket_name,
+                error.response['Error']['Code'], error.response['Error']['Message']
             )
             raise error
 
+    @_s3_call("list objects with metadata", key_index=None)
     def list_objects_with_metadata(
         self,
         prefix: Optional[str] = None,
@@ -547,70 +1263,64 @@ class S3Helper:
         :param max_pages: Maximum number of pages to retrieve (None for all).
         :return: Dict containing objects, common prefixes, and metadata.
         """
-        logger.info(f"Listing objects with metadata in bucket {self.bucket_name}")
+        logger.info("Listing objects with metadata in bucket %s", self.bucket_name)
         all_objects = []
         all_common_prefixes = []
         page_count = 0
         total_objects_found = 0
         
-        try:
-            kwargs = {
-                'Bucket': self.bucket_name,
-                'MaxKeys': max_keys
-            }
-            
-            if prefix:
-                kwargs['Prefix'] = prefix
-            if delimiter:
-                kwargs['Delimiter'] = delimiter
+        kwargs = {
+            'Bucket': self.bucket_name,
+            'MaxKeys': max_keys
+        }
+        
+        if prefix:
+            kwargs['Prefix'] = prefix
+        if delimiter:
+            kwargs['Delimiter'] = delimiter
+        
+        # Create paginator
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(**kwargs)
+        
+        for page in pages:
+            page_count += 1
+            objects = page.get('Contents', [])
+            common_prefixes = page.get('CommonPrefixes', [])
             
-            # Create paginator
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            pages = paginator.paginate(**kwargs)
+            all_objects.extend(objects)
+            all_common_prefixes.extend(common_prefixes)
+            total_objects_found += len(objects)
             
-            for page in pages:
-                page_count += 1
-                objects = page.get('Contents', [])
-                common_prefixes = page.get('CommonPrefixes', [])
-                
-                all_objects.extend(objects)
-                all_common_prefixes.extend(common_prefixes)
-                total_objects_found += len(objects)
-                
-                logger.debug(
-                    f"Page {page_count}: Retrieved {len(objects)} objects, "
-                    f"{len(common_prefixes)} common prefixes"
-                )
-                
-                # Check if we've reached max pages
-                if max_pages and page_count >= max_pages:
-                    logger.info(f"Reached maximum page limit of {max_pages}")
-                    break
+            logger.debug(
+                "Page %s: Retrieved %s objects, "
+                "%s common prefixes",
+                page_count, len(objects), len(common_prefixes)
+            )
             
-            result = {
-                'objects': all_objects,
-                'common_prefixes': all_common_prefixes,
-                'metadata': {
-                    'total_objects': total_objects_found,
-                    'total_pages': page_count,
-                    'bucket': self.bucket_name,
-                    'prefix': prefix,
-                    'delimiter': delimiter
-                }
+            # Check if we've reached max pages
+            if max_pages and page_count >= max_pages:
+                logger.info("Reached maximum page limit of %s", max_pages)
+                break
+        
+        result = {
+            'objects': all_objects,
+            'common_prefixes': all_common_prefixes,
+            'metadata': {
+                'total_objects': total_objects_found,
+                'total_pages': page_count,
+                'bucket': self.bucket_name,
+                'prefix': prefix,
+                'delimiter': delimiter
             }
-            
-            logger.info(
-                f"Found {total_objects_found} objects and {len(all_common_prefixes)} "
-                f"common prefixes across {page_count} pages"
-            )
-            return result
-        except ClientError as error:
-            logger.error(
-                f"Failed to list objects with metadata - Bucket: {self.bucket_name} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
-            )
-            raise error
+        }
+        
+        logger.info(
+            "Found %s objects and %s "
+            "common prefixes across %s pages",
+            total_objects_found, len(all_common_prefixes), page_count
+        )
+        return result
 
     def list_objects_by_last_modified(
         self,
@@ -630,34 +1340,26 @@ class S3Helper:
         :param max_pages: Maximum number of pages to retrieve (None for all).
         :return: List of object metadata within the date range.
         """
-        from datetime import datetime
-        
         logger.info(
-            f"Listing objects by last modified date - "
-            f"Start: {start_date}, End: {end_date}"
+            "Listing objects by last modified date - "
+            "Start: %s, End: %s",
+            start_date, end_date
         )
         
-        # Get all objects first
-        all_objects = self.list_objects(
-            prefix=prefix,
-            max_keys=max_keys,
-            max_pages=max_pages
-        )
+        # Parse the bounds once instead of per object
+        start = datetime.fromisoformat(start_date).date() if start_date else None
+        end = datetime.fromisoformat(end_date).date() if end_date else None
         
-        # Filter by date range if specified
+        # Filter while paginating so rejected objects are never accumulated
         filtered_objects = []
-        for obj in all_objects:
+        for obj in self._iter_objects(prefix=prefix, max_keys=max_keys, max_pages=max_pages):
             last_modified = obj.get('LastModified')
             if last_modified:
-                if start_date:
-                    if last_modified.date() < datetime.fromisoformat(start_date).date():
-                        continue
-                if end_date:
-                    if last_modified.date() > datetime.fromisoformat(end_date).date():
-                        continue
-                filtered_objects.append(obj)
+                modified = last_modified.date()
+                if (start is None or modified >= start) and (end is None or modified <= end):
+                    filtered_objects.append(obj)
         
-        logger.info(f"Found {len(filtered_objects)} objects in date range")
+        logger.info("Found %s objects in date range", len(filtered_objects))
         return filtered_objects
 
     def list_objects_by_size(
@@ -678,26 +1380,16 @@ class S3Helper:
         :param max_pages: Maximum number of pages to retrieve (None for all).
         :return: List of object metadata within the size range.
         """
-        logger.info(f"Listing objects by size - Min: {min_size}, Max: {max_size}")
+        logger.info("Listing objects by size - Min: %s, Max: %s", min_size, max_size)
         
-        # Get all objects first
-        all_objects = self.list_objects(
-            prefix=prefix,
-            max_keys=max_keys,
-            max_pages=max_pages
-        )
+        # Filter while paginating so rejected objects are never accumulated
+        filtered_objects = [
+            obj for obj in self._iter_objects(prefix=prefix, max_keys=max_keys, max_pages=max_pages)
+            if (min_size is None or obj.get('Size', 0) >= min_size)
+            and (max_size is None or obj.get('Size', 0) <= max_size)
+        ]
         
-        # Filter by size range if specified
-        filtered_objects = []
-        for obj in all_objects:
-            size = obj.get('Size', 0)
-            if min_size is not None and size < min_size:
-                continue
-            if max_size is not None and size > max_size:
-                continue
-            filtered_objects.append(obj)
-        
-        logger.info(f"Found {len(filtered_objects)} objects in size range")
+        logger.info("Found %s objects in size range", len(filtered_objects))
         return filtered_objects
 
     def list_objects_recursively(
@@ -709,39 +1401,45 @@ class S3Helper:
         """
         List objects recursively, organizing by directory structure.
 
+        Sibling directories are listed concurrently; each listing is submitted
+        as soon as its parent's common prefixes are known.
+
         :param prefix: Prefix to filter objects.
         :param max_keys: Maximum number of keys per request.
         :param max_pages: Maximum number of pages to retrieve (None for all).
         :return: Dict with directory structure.
         """
-        logger.info(f"Listing objects recursively in bucket {self.bucket_name}")
+        logger.info("Listing objects recursively in bucket %s", self.bucket_name)
         
-        # Get objects with delimiter first to find directories
-        result = self.list_objects_with_metadata(
-            prefix=prefix,
-            delimiter='/',
-            max_keys=max_keys,
-            max_pages=max_pages
-        )
-        
-        directory_structure = {
-            'files': result['objects'],
-            'directories': {}
-        }
+        directory_structure = {'files': [], 'directories': {}}
         
-        # Process common prefixes (directories)
-        for common_prefix in result['common_prefixes']:
-            prefix_key = common_prefix['Prefix']
-            logger.debug(f"Processing directory: {prefix_key}")
-            
-            # Recursively get contents of this directory
-            subdir_result = self.list_objects_recursively(
-                prefix=prefix_key,
-                max_keys=max_keys,
-                max_pages=max_pages
-            )
+        # One pool per call bounds in-flight listings; workers never wait on
+        # each other, so nested directories cannot starve the pool
+        with concurrent.futures.ThreadPoolExecutor(max_workers=_LIST_WORKERS) as executor:
+            def submit(directory_prefix: Optional[str]) -> concurrent.futures.Future:
+                return executor.submit(
+                    self.list_objects_with_metadata,
+                    prefix=directory_prefix,
+                    delimiter='/',
+                    max_keys=max_keys,
+                    max_pages=max_pages
+                )
             
-            directory_structure['directories'][prefix_key] = subdir_result
+            pending = {submit(prefix): directory_structure}
+            while pending:
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    node = pending.pop(future)
+                    result = future.result()
+                    node['files'] = result['objects']
+                    
+                    # Process common prefixes (directories)
+                    for common_prefix in result['common_prefixes']:
+                        prefix_key = common_prefix['Prefix']
+                        logger.debug("Processing directory: %s", prefix_key)
+                        subdir = {'files': [], 'directories': {}}
+                        node['directories'][prefix_key] = subdir
+                        pending[submit(prefix_key)] = subdir
         
         return directory_structure
     
@@ -751,29 +1449,35 @@ class S3Helper:
         delimiter: Optional[str] = None,
         max_keys: int = 1000,
         max_pages: Optional[int] = None,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        start_after: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         List objects with advanced filtering options.
 
+        Filters are applied while paginating, so objects that do not match are
+        never accumulated.
+
         :param prefix: Prefix to filter objects.
         :param delimiter: Delimiter for grouping keys.
         :param max_keys: Maximum number of keys per request.
         :param max_pages: Maximum number of pages to retrieve (None for all).
         :param filters: Dict with filter criteria (e.g., 'extension', 'min_size', 'max_size', 'date_range').
+        :param start_after: Key to start listing after, to resume a previous listing.
         :return: Dict containing filtered objects and metadata.
         """
-        logger.info(f"Listing objects with advanced filters in bucket {self.bucket_name}")
+        logger.info("Listing objects with advanced filters in bucket %s", self.bucket_name)
         
-        # Get all objects first
-        all_objects = self.list_objects(
+        objects = self._iter_objects(
             prefix=prefix,
             delimiter=delimiter,
             max_keys=max_keys,
-            max_pages=max_pages
+            max_pages=max_pages,
+            start_after=start_after
         )
         
         if not filters:
+            all_objects = list(objects)
             return {
                 'objects': all_objects,
                 'metadata': {
@@ -782,72 +1486,27 @@ class S3Helper:
                 }
             }
         
+        predicate = _compile_filters(filters)
+        original_count = 0
         filtered_objects = []
-        for obj in all_objects:
-            # Apply filters
-            if not _apply_object_filters(obj, filters):
-                continue
-            filtered_objects.append(obj)
+        for obj in objects:
+            original_count += 1
+            if predicate(obj):
+                filtered_objects.append(obj)
         
         result = {
             'objects': filtered_objects,
             'metadata': {
                 'total_count': len(filtered_objects),
-                'original_count': len(all_objects),
+                'original_count': original_count,
                 'bucket': self.bucket_name,
                 'filters_applied': filters
             }
         }
         
         logger.info(
-            f"Applied filters: {len(filtered_objects)} objects out of {len(all_objects)} "
-            f"matched the criteria"
+            "Applied filters: %s objects out of %s "
+            "matched the criteria",
+            len(filtered_objects), original_count
         )
         return result
-
-
-    def _apply_object_filters(obj: Dict[str, Any], filters: Dict[str, Any]) -> bool:
-        """
-        Apply filters to object metadata.
-
-        :param obj: Object metadata.
-        :param filters: Filter criteria.
-        :return: True if object passes all filters.
-        """
-        # Extension filter
-        if 'extension' in filters:
-            expected_ext = filters['extension']
-            key = obj.get('Key', '')
-            if not key.lower().endswith(f".{expected_ext.lower()}"):
-                return False
-        
-        # Size filters
-        size = obj.get('Size', 0)
-        if 'min_size' in filters and size < filters['min_size']:
-            return False
-        if 'max_size' in filters and size > filters['max_size']:
-            return False
-        
-        # Date filter
-        if 'date_range' in filters:
-            from datetime import datetime
-            last_modified = obj.get('LastModified')
-            if last_modified:
-                date_range = filters['date_range']
-                start_date = date_range.get('start')
-                end_date = date_range.get('end')
-                
-                if start_date and last_modified.date() < datetime.fromisoformat(start_date).date():
-                    return False
-                if end_date and last_modified.date() > datetime.fromisoformat(end_date).date():
-                    return False
-        
-        # Key pattern filter
-        if 'key_pattern' in filters:
-            import re
-            pattern = filters['key_pattern']
-            key = obj.get('Key', '')
-            if not re.search(pattern, key):
-                return False
-        
-        return True
\ No newline at end of file
@@ -0,0 +1,56 @@
+import io
+import unittest
+import zipfile
+from unittest import mock
+
+# utils crea la sesión AWS y los helpers al importarse
+with mock.patch("boto3.setup_default_session"), \
+        mock.patch("s3_helper.S3Helper"), \
+        mock.patch("dynamodb_helper.DynamoDBHelper"):
+    import utils
+
+_DOCUMENT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+            xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"
+            xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+            xmlns:v="urn:schemas-microsoft-com:vml">
+  <w:body>
+    <w:p><w:r><w:t>Hello</w:t></w:r></w:p>
+    <w:p>
+      <w:r>
+        <mc:AlternateContent>
+          <mc:Choice Requires="wps">
+            <w:drawing><wps:txbx><w:txbxContent>
+              <w:p><w:r><w:t>BoxText</w:t></w:r></w:p>
+            </w:txbxContent></wps:txbx></w:drawing>
+          </mc:Choice>
+          <mc:Fallback>
+            <w:pict><v:shape><v:textbox><w:txbxContent>
+              <w:p><w:r><w:t>BoxText</w:t></w:r></w:p>
+            </w:txbxContent></v:textbox></v:shape></w:pict>
+          </mc:Fallback>
+        </mc:AlternateContent>
+      </w:r>
+      <w:r><w:t>After</w:t><w:tab/><w:t>Tab</w:t></w:r>
+    </w:p>
+    <w:tbl><w:tr><w:tc><w:p><w:r><w:t>Cell</w:t><w:br/><w:t>Line</w:t></w:r></w:p></w:tc></w:tr></w:tbl>
+  </w:body>
+</w:document>
+"""
+
+
+def _make_docx(document_xml: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", document_xml)
+    return buffer.getvalue()
+
+
+class ExtractTextFromDocxBytesTest(unittest.TestCase):
+    def test_text_box_is_extracted_once_as_its_own_paragraph(self):
+        text = utils.extract_text_from_docx_bytes(_make_docx(_DOCUMENT))
+        self.assertEqual(text, "Hello\nBoxText\nAfter\tTab\nCell\nLine")
+
+
+if __name__ == "__main__":
+    unittest.main()
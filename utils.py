@@ -1,49 +1,127 @@
+import asyncio
 import boto3
+import gzip
 import logging
+import math
+import multiprocessing
+import multiprocessing.context
 import os
 import re
+import threading
 import unicodedata
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from dotenv import load_dotenv
 from io import BytesIO
-from PyPDF2 import PdfReader
-from docx import Document
+from logging.handlers import RotatingFileHandler
+from lxml import etree
 
-from s3_helper import S3Helper
+import pdf_worker
+from cache_helper import TTLCache
+from botocore.exceptions import ClientError
+from s3_helper import MIRROR_PREFIX, S3Helper
 from dynamodb_helper import DynamoDBHelper
 
 load_dotenv()
 
+# Los procesos del pool de PDFs (spawn) vuelven a importar __main__ y con él
+# este módulo. Se reconocen por su nombre, que spawn asigna antes de reimportar,
+# y omiten la configuración con efectos secundarios. Otros procesos hijos (p. ej.
+# workers de uvicorn) se configuran con normalidad
+_PDF_WORKER_NAME = "PdfWorker"
+_IS_PDF_WORKER = multiprocessing.current_process().name == _PDF_WORKER_NAME
+
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    filename='logs/utils.log', filemode='w',
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-)
+logger.setLevel(logging.INFO)
+if not _IS_PDF_WORKER:
+    # Archivo rotativo en modo append: no se trunca al reiniciar el proceso.
+    # Varios procesos rotando el mismo archivo perderían líneas
+    os.makedirs('logs', exist_ok=True)
+    _log_handler = RotatingFileHandler('logs/utils.log', maxBytes=10_000_000, backupCount=3)
+    _log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    logger.addHandler(_log_handler)
 
 S3_RESOURCES_BUCKET = os.getenv("S3_RESOURCES_BUCKET")
 S3_PATH = "SOFIA_FILE/PLANIFICACION/AV_Recursos"
 
+# Descargas y extracciones simultáneas por silabo
+MAX_CONCURRENT_LOADS = 16
+
+# PDFs con menos páginas se procesan en línea para evitar el costo del pool:
+# con PyPDF2 (Python puro) compensa desde pocas páginas; con PDFium (nativo)
+# solo en documentos largos
+PDF_PARALLEL_MIN_PAGES = 4
+PDFIUM_PARALLEL_MIN_PAGES = 64
+
+# Archivos mayores se descargan con GETs por rangos en paralelo
+PARALLEL_GET_MIN_SIZE = 8 * 1024 * 1024
+
+# Tamaño máximo (bytes) de archivo a descargar para extraer texto; 0 = sin límite
+MAX_TEXT_FILE_SIZE = int(os.getenv("MAX_TEXT_FILE_SIZE", "0"))
+
 DYNAMO_CHAT_HISTORY_TABLE = os.getenv("DYNAMO_CHAT_HISTORY_TABLE")
 DYNAMO_LIBRARY_TABLE = os.getenv("DYNAMO_LIBRARY_TABLE")
 DYNAMO_RESOURCES_TABLE = os.getenv("DYNAMO_RESOURCES_TABLE")
 DYNAMO_RESOURCES_HASH_TABLE = os.getenv("DYNAMO_RESOURCES_HASH_TABLE")
 
-boto3.setup_default_session(profile_name='dev-upeu-admin')
-
-# Crear helper instances
-s3_helper = S3Helper(bucket_name=S3_RESOURCES_BUCKET)
-files_table_helper = DynamoDBHelper(
-    table_name=DYNAMO_RESOURCES_TABLE,
-    pk_name="resource_id"
-)
-hash_table_helper = DynamoDBHelper(
-    table_name=DYNAMO_RESOURCES_HASH_TABLE,
-    pk_name="file_hash"
-)
-library_table_helper = DynamoDBHelper(
-    table_name=DYNAMO_LIBRARY_TABLE,
-    pk_name="silabus_id"
-)
+# Los workers de PDFs no crean la sesión AWS ni los helpers, que validan
+# bucket y tablas contra AWS al construirse
+if not _IS_PDF_WORKER:
+    boto3.setup_default_session(profile_name='dev-upeu-admin')
+
+    # Crear helper instances
+    s3_helper = S3Helper(bucket_name=S3_RESOURCES_BUCKET)
+    files_table_helper = DynamoDBHelper(
+        table_name=DYNAMO_RESOURCES_TABLE,
+        pk_name="resource_id"
+    )
+    hash_table_helper = DynamoDBHelper(
+        table_name=DYNAMO_RESOURCES_HASH_TABLE,
+        pk_name="file_hash"
+    )
+    library_table_helper = DynamoDBHelper(
+        table_name=DYNAMO_LIBRARY_TABLE,
+        pk_name="silabus_id",
+        enable_cache=True
+    )
+
+# Etiquetas WordprocessingML usadas al recorrer word/document.xml
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_P, _W_T, _W_TAB, _W_BR = f"{_W_NS}p", f"{_W_NS}t", f"{_W_NS}tab", f"{_W_NS}br"
+# Copia alternativa (VML) de los cuadros de texto, duplicada en mc:Choice
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+# Títulos de recursos ya resueltos (solo se guardan los encontrados)
+_title_cache = TTLCache(maxsize=4096)
+
+# Texto extraído por (object_key, ETag): un objeto modificado cambia de ETag
+_text_cache = TTLCache(maxsize=512)
+
+# Textos a partir de este tamaño se guardan comprimidos en la caché
+TEXT_CACHE_GZIP_MIN_CHARS = 256 * 1024
+
+def clear_caches() -> None:
+    """
+    Limpia las cachés en memoria de títulos y de silabos.
+    Útil tras modificar recursos o silabos fuera de este proceso.
+    """
+    _title_cache.clear()
+    _text_cache.clear()
+    library_table_helper.clear_cache()
+
+# Tabla precalculada: separadores a "_" y caracteres latinos/diacríticos a su
+# forma ASCII (NFKD sin marcas), equivalente carácter a carácter al camino lento
+_FILENAME_SEPARATORS = str.maketrans({c: "_" for c in "., "})
+_FILENAME_TABLE = str.maketrans({
+    **{
+        chr(cp): unicodedata.normalize('NFKD', chr(cp))
+        .encode('ASCII', 'ignore')
+        .decode('ASCII')
+        .translate(_FILENAME_SEPARATORS)
+        for cp in range(0x80, 0x370)
+    },
+    **{c: "_" for c in "., "},
+})
 
 # Limpieza de nombres de archivos y extracción de extensiones
 def sanitize_filename(filename: str) -> str:
@@ -53,6 +131,11 @@ def sanitize_filename(filename: str) -> str:
     :param filename: Nombre original del archivo
     :return: Nombre sanitizado
     """
+    sanitized = filename.lower().translate(_FILENAME_TABLE)
+    if sanitized.isascii():
+        return sanitized
+
+    # Caracteres fuera de la tabla: normalización completa
     normalized_name = unicodedata.normalize('NFKD', filename.lower()).encode('ASCII', 'ignore').decode('ASCII')
     return re.sub(r"[., ]", "_", normalized_name)
 
@@ -65,70 +148,260 @@ def get_file_extension(file_path: str) -> str:
     """
     return os.path.splitext(file_path)[1].lower().replace(".", "")
 
+# Pool de procesos para extraer PDFs grandes (PyPDF2 es Python puro y PDFium no
+# admite hilos); se crea al primer uso. Con "spawn" los procesos no heredan
+# locks ni estado nativo del proceso padre; al reimportar __main__ omiten la
+# creación de helpers (ver _IS_PDF_WORKER)
+class _PdfWorkerProcess(multiprocessing.context.SpawnProcess):
+    """Proceso spawn con el nombre que identifica a los workers de PDFs."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.name = _PDF_WORKER_NAME
+
+class _PdfWorkerContext(multiprocessing.context.SpawnContext):
+    """Contexto spawn cuyos procesos son _PdfWorkerProcess."""
+    Process = _PdfWorkerProcess
+
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """
+    Obtiene el pool de procesos compartido para la extracción de PDFs.
+
+    :return: Pool de procesos
+    """
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=_PdfWorkerContext(),
+            )
+        return _pdf_pool
+
 # Extraer texto de archivos PDF y DOCX en memoria
 def extract_text_from_pdf_bytes(pdf_bytes: bytes) -> str:
     """
     Extrae texto de un archivo PDF en memoria (bytes).
+
+    Según el número de páginas, el PDF se procesa en línea o se reparte por
+    rangos de páginas entre los procesos del pool (un rango por CPU, de modo
+    que cada proceso abre el documento una sola vez).
     
     :param pdf_bytes: Contenido binario del archivo PDF
     :return: Texto extraído
     """
     try:
-        text = ""
-        reader = PdfReader(BytesIO(pdf_bytes))
-        
-        for page_num in range(len(reader.pages)):
-            page = reader.pages[page_num]
-            text += page.extract_text() + "\n"
+        page_count = pdf_worker.count_pages(pdf_bytes)
+        min_parallel_pages = (
+            PDFIUM_PARALLEL_MIN_PAGES if pdf_worker.pdfium is not None else PDF_PARALLEL_MIN_PAGES
+        )
+
+        if page_count < min_parallel_pages:
+            text = pdf_worker.extract_pages(pdf_bytes)
+        else:
+            step = math.ceil(page_count / (os.cpu_count() or 1))
+            pool = _get_pdf_pool()
+            futures = [
+                pool.submit(pdf_worker.extract_pages, pdf_bytes, start, min(start + step, page_count))
+                for start in range(0, page_count, step)
+            ]
+            text = "\n".join(future.result() for future in futures)
 
         logger.info("Texto extraído exitosamente del PDF en memoria.")
         return text
 
     except Exception as e:
-        logger.error(f"Error extrayendo texto del PDF: {e}")
+        logger.error("Error extrayendo texto del PDF: %s", e)
         raise e
     
 def extract_text_from_docx_bytes(docx_bytes: bytes) -> str:
     """
     Extrae texto de un archivo DOCX en memoria (ej. S3, stream, etc.).
 
+    Recorre word/document.xml en streaming en lugar de construir el DOM
+    completo; cada párrafo no vacío se devuelve en una línea.
+
     :param docx_bytes: Contenido binario del archivo DOCX
     :return: Texto extraído
     """
     try:
-        doc = Document(BytesIO(docx_bytes))
-        paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
+        paragraphs = []
+        # Un búfer por párrafo abierto: los cuadros de texto anidan w:p dentro
+        # de otro w:p y su texto se devuelve como párrafo propio
+        buffers = []
+        # Profundidad dentro de mc:Fallback; su texto ya se leyó en mc:Choice
+        fallback_depth = 0
+        with zipfile.ZipFile(BytesIO(docx_bytes)) as archive, archive.open("word/document.xml") as document:
+            events = etree.iterparse(
+                document, events=("start", "end"), tag=(_W_P, _W_T, _W_TAB, _W_BR, _MC_FALLBACK)
+            )
+            for event, element in events:
+                tag = element.tag
+                if tag == _MC_FALLBACK:
+                    fallback_depth += 1 if event == "start" else -1
+                elif fallback_depth:
+                    continue
+                elif tag == _W_P:
+                    if event == "start":
+                        buffers.append([])
+                        continue
+                    paragraph = "".join(buffers.pop())
+                    if paragraph.strip():
+                        paragraphs.append(paragraph)
+                    # Liberar los párrafos ya procesados para mantener el árbol pequeño
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+                elif event == "end" and buffers:
+                    if tag == _W_T:
+                        buffers[-1].append(element.text or "")
+                    elif tag == _W_TAB:
+                        buffers[-1].append("\t")
+                    else:
+                        buffers[-1].append("\n")
         extracted_text = "\n".join(paragraphs)
         logger.info("Texto extraído exitosamente de DOCX en memoria.")
         return extracted_text
     except Exception as e:
-        logger.error(f"Error extrayendo texto de DOCX desde bytes: {e}")
+        logger.error("Error extrayendo texto de DOCX desde bytes: %s", e)
         raise e
 
-async def get_text_from_file_by_title(title: str) -> str:
+def extract_text_from_bytes(file_bytes: bytes, file_type: str) -> str:
+    """
+    Extrae texto de un archivo en memoria según su extensión.
+
+    :param file_bytes: Contenido binario del archivo
+    :param file_type: Extensión del archivo (pdf, docx, doc)
+    :return: Texto extraído o cadena vacía si el tipo no es soportado
+    """
+    if file_type == "pdf":
+        return extract_text_from_pdf_bytes(file_bytes)
+    elif file_type == "docx" or file_type == "doc":
+        return extract_text_from_docx_bytes(file_bytes)
+    else:
+        logger.error("Tipo de archivo no soportado: %s", file_type)
+        return ""
+
+def load_text_from_s3(object_key: str, file_type: str) -> str:
+    """
+    Obtiene el texto de un objeto de S3, reutilizando la extracción previa
+    mientras el ETag del objeto no cambie.
+
+    :param object_key: Clave del objeto en S3
+    :param file_type: Extensión del archivo (pdf, docx, doc)
+    :return: Texto extraído (vacío si supera MAX_TEXT_FILE_SIZE)
+    """
+    metadata = s3_helper.get_object_metadata(object_key)
+    if MAX_TEXT_FILE_SIZE and metadata['ContentLength'] > MAX_TEXT_FILE_SIZE:
+        logger.warning(
+            "Archivo %s omitido: %s bytes superan el límite de %s",
+            object_key, metadata['ContentLength'], MAX_TEXT_FILE_SIZE
+        )
+        return ""
+
+    etag = metadata['ETag']
+    cached = _text_cache.get((object_key, etag))
+    if cached is not None:
+        logger.info("Texto de %s obtenido desde caché", object_key)
+        return gzip.decompress(cached).decode() if isinstance(cached, bytes) else cached
+
+    if metadata['ContentLength'] > PARALLEL_GET_MIN_SIZE:
+        # Los rangos se piden con IfMatch sobre este mismo ETag
+        file_bytes = s3_helper.get_object_parallel(object_key, metadata=metadata)
+    else:
+        response = s3_helper.get_object(object_key=object_key)
+        file_bytes = response['Body'].read()
+        etag = response['ETag']
+    logger.info("Descargados %s bytes de %s", len(file_bytes), object_key)
+    text = extract_text_from_bytes(file_bytes, file_type)
+
+    entry = gzip.compress(text.encode()) if len(text) >= TEXT_CACHE_GZIP_MIN_CHARS else text
+    _text_cache.set((object_key, etag), entry)
+    return text
+
+def load_text_prefix_from_s3(object_key: str, file_type: str, byte_range: tuple[int, int]) -> str:
+    """
+    Intenta extraer texto descargando solo un rango de bytes del objeto.
+    Si el formato no se puede leer truncado (p. ej. PDF o DOCX incompletos),
+    se descarga el archivo completo.
+
+    :param object_key: Clave del objeto en S3
+    :param file_type: Extensión del archivo (pdf, docx, doc)
+    :param byte_range: Rango (inicio, fin) de bytes, ambos incluidos
+    :return: Texto extraído
+    """
+    response = s3_helper.get_object(object_key=object_key, byte_range=byte_range)
+    file_bytes = response['Body'].read()
+    logger.info("Descargados %s bytes (rango %s) de %s", len(file_bytes), byte_range, object_key)
+    try:
+        return extract_text_from_bytes(file_bytes, file_type)
+    except Exception as e:
+        logger.warning("No se pudo extraer texto del rango de %s, se descarga completo: %s", object_key, e)
+        return load_text_from_s3(object_key, file_type)
+
+async def get_text_from_file_by_title(title: str, byte_range: tuple[int, int] | None = None) -> str:
     """
     Extrae texto de un archivo en memoria (bytes) según su tipo.
 
+    La descarga y la extracción se ejecutan en un hilo para no bloquear el
+    event loop; los PDFs grandes se reparten además entre los procesos del pool.
+
     :param title: Título del archivo
+    :param byte_range: Rango (inicio, fin) de bytes a descargar, para vistas previas (opcional)
     :return: Texto extraído
     """
     try:
         file_type = get_file_extension(title)
         object_key = f"{S3_PATH}/{sanitize_filename(title)}"
 
-        response = s3_helper.get_object(object_key=object_key)
-        file_bytes = response['Body'].read()
-
-        if file_type == "pdf":
-            return extract_text_from_pdf_bytes(file_bytes)
-        elif file_type == "docx" or file_type == "doc":
-            return extract_text_from_docx_bytes(file_bytes)
-        else:
-            logger.error(f"Tipo de archivo no soportado: {file_type}")
-            return ""
+        if byte_range is not None:
+            return await asyncio.to_thread(load_text_prefix_from_s3, object_key, file_type, byte_range)
+        try:
+            return await asyncio.to_thread(load_text_from_s3, object_key, file_type)
+        except ClientError as error:
+            if error.response['Error']['Code'] not in ('404', 'NoSuchKey'):
+                raise
+            # Objeto recién escrito aún no visible: se intenta la copia espejo
+            logger.warning("Objeto %s no encontrado, se intenta la copia espejo", object_key)
+            return await asyncio.to_thread(load_text_from_s3, MIRROR_PREFIX + object_key, file_type)
     except Exception as e:
-        logger.error(f"Error obteniendo texto del archivo {file_type}: {e}")
+        logger.error("Error obteniendo texto del archivo %s: %s", file_type, e)
         return ""
+
+async def get_texts_for_silabus(silabus_id: str) -> dict[str, str]:
+    """
+    Obtiene el texto de todos los recursos de un silabo de forma concurrente.
+
+    La lectura de S3 y la extracción se ejecutan en hilos, con un máximo
+    de MAX_CONCURRENT_LOADS recursos en curso a la vez.
+
+    :param silabus_id: ID del silabo
+    :return: Diccionario título -> texto extraído (vacío si falló)
+    """
+    titles = await get_titles_resources_by_silabus(silabus_id)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOADS)
+
+    async def _load(title: str) -> str:
+        async with semaphore:
+            file_type = get_file_extension(title)
+            object_key = f"{S3_PATH}/{sanitize_filename(title)}"
+            return await asyncio.to_thread(load_text_from_s3, object_key, file_type)
+
+    results = await asyncio.gather(*(_load(title) for title in titles), return_exceptions=True)
+
+    texts = {}
+    for title, result in zip(titles, results):
+        if isinstance(result, Exception):
+            logger.error("Error obteniendo texto del recurso %s: %s", title, result)
+            texts[title] = ""
+        else:
+            texts[title] = result
+
+    logger.info("Se obtuvo el texto de %s recurso(s) del silabo %s", len(titles), silabus_id)
+    return texts
     
 async def get_titles_resources_by_silabus(silabus_id: str) -> list[str]:
     """
@@ -142,21 +415,42 @@ async def get_titles_resources_by_silabus(silabus_id: str) -> list[str]:
         if library_item and "resources" in library_item:
             resources = library_item["resources"]
         else:
-            logger.warning(f"No se encontraron recursos para el silabo {silabus_id}")
+            logger.warning("No se encontraron recursos para el silabo %s", silabus_id)
             return []
         
         resource_ids = [resource["resource_id"] for resource in resources]
-        logger.info(f"Se encontraron {len(resource_ids)} resource_id(s) en el silabo {silabus_id}")
+        logger.info("Se encontraron %s resource_id(s) en el silabo %s", len(resource_ids), silabus_id)
+
+        # Solo se consultan los títulos que no están en caché, en una lectura por lotes
+        titles_by_id = {}
+        missing_ids = []
+        for resource_id in resource_ids:
+            title = _title_cache.get(resource_id)
+            if title is None:
+                missing_ids.append(resource_id)
+            else:
+                titles_by_id[resource_id] = title
+
+        if missing_ids:
+            items = files_table_helper.batch_get_items(
+                [{"resource_id": resource_id} for resource_id in missing_ids]
+            )
+            for item in items:
+                if "resource_title" in item:
+                    titles_by_id[item["resource_id"]] = item["resource_title"]
+                    _title_cache.set(item["resource_id"], item["resource_title"])
 
         titles = []
         for resource_id in resource_ids:
-            title = get_title_from_resource_id(resource_id)
+            title = titles_by_id.get(resource_id)
             if title:
                 titles.append(title)
+            else:
+                logger.warning("No se encontró el recurso con ID %s", resource_id)
 
         return titles
     except Exception as e:
-        logger.error(f"Error obteniendo títulos de recursos para el silabo {silabus_id}: {e}")
+        logger.error("Error obteniendo títulos de recursos para el silabo %s: %s", silabus_id, e)
         return []
     
 def get_title_from_resource_id(resource_id: str) -> str:
@@ -166,13 +460,18 @@ def get_title_from_resource_id(resource_id: str) -> str:
     :param resource_id: ID del recurso
     :return: Título del recurso o None si no se encuentra
     """
+    title = _title_cache.get(resource_id)
+    if title is not None:
+        return title
+
     try:
         item = files_table_helper.get_item(resource_id)
         if item and "resource_title" in item:
+            _title_cache.set(resource_id, item["resource_title"])
             return item["resource_title"]
         else:
-            logger.warning(f"No se encontró el recurso con ID {resource_id}")
+            logger.warning("No se encontró el recurso con ID %s", resource_id)
             return None
     except Exception as e:
-        logger.error(f"Error obteniendo título del recurso {resource_id}: {e}")
+        logger.error("Error obteniendo título del recurso %s: %s", resource_id, e)
         return None
\ No newline at end of file